@@ -41,6 +41,10 @@ OMDB_BASE_URL = "http://www.omdbapi.com"
 TMDB_BASE_URL = "https://api.themoviedb.org/3"
 YTS_API_URL = "https://yts.mx/api/v2"
 
+# One opener for every request (handlers are built once, not per call)
+_opener = urllib.request.build_opener()
+_opener.addheaders = [('User-Agent', 'Mozilla/5.0')]
+
 
 @dataclass
 class MovieInfo:
@@ -123,8 +127,7 @@ class TermflixAPI:
     def _fetch_json(url: str, timeout: int = 5) -> Optional[Dict]:
         """Fetch JSON from URL"""
         try:
-            req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-            with urllib.request.urlopen(req, timeout=timeout) as response:
+            with _opener.open(url, timeout=timeout) as response:
                 return json.loads(response.read().decode('utf-8'))
         except Exception:
             return None
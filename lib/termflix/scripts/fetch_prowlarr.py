@@ -11,27 +11,106 @@ import urllib.request
 import urllib.parse
 import urllib.error
 import re
+import functools
+import sqlite3
+import threading
+import time
+from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Cache for YTS poster lookups (title -> poster_url)
 _poster_cache = {}
 
+# Persistent poster cache shared across runs (keyed by normalized title + year)
+POSTER_DB = Path.home() / ".cache" / "termflix" / "yts_posters.sqlite"
+POSTER_TTL = 7 * 24 * 60 * 60   # 7 days for hits
+POSTER_NULL_TTL = 6 * 60 * 60   # 6 hours for misses, so new releases get retried
+_db_lock = threading.Lock()
+_db = None
+
+def _poster_db():
+    """Open (once) the on-disk poster cache"""
+    global _db
+    if _db is None:
+        POSTER_DB.parent.mkdir(parents=True, exist_ok=True)
+        _db = sqlite3.connect(str(POSTER_DB), timeout=5, check_same_thread=False)
+        _db.execute('PRAGMA journal_mode=WAL')
+        _db.execute(
+            'CREATE TABLE IF NOT EXISTS posters ('
+            'title TEXT NOT NULL, year TEXT NOT NULL, poster TEXT, fetched_at REAL NOT NULL, '
+            'PRIMARY KEY (title, year))'
+        )
+        _db.commit()
+    return _db
+
+def _disk_cache_get(movie_name, year):
+    """Return (hit, poster_url) from the on-disk cache, honoring TTLs"""
+    try:
+        with _db_lock:
+            row = _poster_db().execute(
+                'SELECT poster, fetched_at FROM posters WHERE title = ? AND year = ?',
+                (movie_name.lower(), year or '')
+            ).fetchone()
+    except sqlite3.Error:
+        return False, None
+    if not row:
+        return False, None
+    poster, fetched_at = row
+    ttl = POSTER_TTL if poster else POSTER_NULL_TTL
+    if time.time() - fetched_at > ttl:
+        return False, None
+    return True, poster
+
+def _disk_cache_put(movie_name, year, poster):
+    """Write a poster lookup result through to the on-disk cache"""
+    try:
+        with _db_lock:
+            db = _poster_db()
+            db.execute(
+                'INSERT OR REPLACE INTO posters (title, year, poster, fetched_at) VALUES (?, ?, ?, ?)',
+                (movie_name.lower(), year or '', poster, time.time())
+            )
+            db.commit()
+    except sqlite3.Error:
+        pass  # Cache is best-effort
+
+# Query-string templates
+YTS_SEARCH_URL = "https://yts.mx/api/v2/list_movies.json?limit={limit}&query_term={query}"
+
+@functools.lru_cache(maxsize=None)
+def api_base_url(url, path, api_key):
+    """Base endpoint URL with the (URL-encoded) API key already appended"""
+    return f"{url.rstrip('/')}{path}?{urllib.parse.urlencode({'apikey': api_key})}"
+
+# Title parsing patterns
+_YEAR_PAREN_RE = re.compile(r'^(.+?)\s*\((\d{4})\)')
+_YEAR_SEP_RE = re.compile(r'^(.+?)[\.\s]+(\d{4})[\.\s]')
+_YEAR_ANY_RE = re.compile(r'(\d{4})')
+
+# Torrents that YTS (movies only) can never match
+_TV_RE = re.compile(r'\bS\d{2}E\d{2}\b|\bS\d{2}\b|\bSeason[\s.]*\d+\b|\bComplete[\s.]Series\b', re.IGNORECASE)
+_SOFTWARE_RE = re.compile(r'\.(?:iso|dmg|exe|apk)\b|\bx64\b|\bCrack(?:ed)?\b|\bKeygen\b|\bPortable\b', re.IGNORECASE)
+
+def is_non_movie(title):
+    """True for TV episodes/season packs and software releases"""
+    return bool(_TV_RE.search(title) or _SOFTWARE_RE.search(title))
+
 def extract_movie_info(title):
     """Extract movie name and year from torrent title"""
     # Pattern: "Movie Name (2024)" or "Movie.Name.2024.1080p..."
     # Try parentheses first
-    match = re.search(r'^(.+?)\s*\((\d{4})\)', title)
+    match = _YEAR_PAREN_RE.search(title)
     if match:
         return match.group(1).strip(), match.group(2)
     
     # Try dot/space separated year
-    match = re.search(r'^(.+?)[\.\s]+(\d{4})[\.\s]', title)
+    match = _YEAR_SEP_RE.search(title)
     if match:
         name = match.group(1).replace('.', ' ').strip()
         return name, match.group(2)
     
     # Just try to find a year anywhere
-    match = re.search(r'(\d{4})', title)
+    match = _YEAR_ANY_RE.search(title)
     if match:
         year = match.group(1)
         name = title.split(year)[0].replace('.', ' ').strip()
@@ -39,6 +118,34 @@ def extract_movie_info(title):
     
     return title.replace('.', ' ').strip(), None
 
+def fetch_yts_posters_batch(query, limit=50):
+    """
+    Fetch posters for every YTS match of a search query in one request.
+    Returns a lookup of (title_lower, year) -> poster_url, plus (title_lower, None)
+    for year-less torrent titles.
+    """
+    lookup = {}
+    if not query or query == '*':
+        return lookup
+    
+    try:
+        url = YTS_SEARCH_URL.format(limit=limit, query=urllib.parse.quote_plus(query))
+        req = urllib.request.Request(url, headers={
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+        })
+        with urllib.request.urlopen(req, timeout=5) as response:
+            data = json.load(response)
+    except Exception:
+        return lookup
+    
+    for movie in (data.get('data') or {}).get('movies') or []:
+        poster = movie.get('medium_cover_image') or movie.get('large_cover_image')
+        title = (movie.get('title') or '').lower()
+        if poster and title:
+            lookup.setdefault((title, str(movie.get('year', ''))), poster)
+            lookup.setdefault((title, None), poster)
+    return lookup
+
 def fetch_yts_poster(movie_name, year=None):
     """Fetch poster URL from YTS API for a given movie"""
     if not movie_name:
@@ -48,32 +155,36 @@ def fetch_yts_poster(movie_name, year=None):
     if cache_key in _poster_cache:
         return _poster_cache[cache_key]
     
+    hit, poster = _disk_cache_get(movie_name, year)
+    if hit:
+        _poster_cache[cache_key] = poster
+        return poster
+    
     try:
         # Build YTS search query
-        query = movie_name
-        params = {
-            'query_term': query,
-            'limit': 1
-        }
-        url = f"https://yts.mx/api/v2/list_movies.json?{urllib.parse.urlencode(params)}"
+        url = YTS_SEARCH_URL.format(limit=1, query=urllib.parse.quote_plus(movie_name))
         
         req = urllib.request.Request(url, headers={
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
         
         with urllib.request.urlopen(req, timeout=3) as response:
-            data = json.loads(response.read().decode('utf-8'))
+            data = json.load(response)
         
         if data.get('status') == 'ok' and data.get('data', {}).get('movies'):
             movie = data['data']['movies'][0]
             poster = movie.get('medium_cover_image') or movie.get('large_cover_image')
             if poster:
                 _poster_cache[cache_key] = poster
+                _disk_cache_put(movie_name, year, poster)
                 return poster
     except Exception:
-        pass  # Silently fail - poster is optional
+        # Network failure - don't persist a miss, just skip this run
+        _poster_cache[cache_key] = None
+        return None
     
     _poster_cache[cache_key] = None
+    _disk_cache_put(movie_name, year, None)
     return None
 
 def fetch_jackett(url, api_key, query, limit=50):
@@ -82,21 +193,15 @@ def fetch_jackett(url, api_key, query, limit=50):
     Endpoint: {url}/api/v2.0/indexers/all/results?apikey={key}&Query={query}
     """
     try:
-        params = urllib.parse.urlencode({
-            'apikey': api_key,
-            'Query': query,
-            'Category': '',
-            'Tracker': ''
-        })
-        
-        full_url = f"{url.rstrip('/')}/api/v2.0/indexers/all/results?{params}"
+        base = api_base_url(url, '/api/v2.0/indexers/all/results', api_key)
+        full_url = f"{base}&Query={urllib.parse.quote_plus(query)}&Category=&Tracker="
         
         req = urllib.request.Request(full_url, headers={
             'User-Agent': 'Termflix/1.0'
         })
         
         with urllib.request.urlopen(req, timeout=15) as response:
-            data = json.loads(response.read().decode('utf-8'))
+            data = json.load(response)
         
         results = []
         if 'Results' in data:
@@ -127,14 +232,11 @@ def fetch_prowlarr(url, api_key, query, limit=50):
     """
     try:
         # Special handling for wildcard query
+        base = api_base_url(url, '/api/v1/search', api_key)
         if query == '*' or query == '':
-            full_url = f"{url.rstrip('/')}/api/v1/search?apikey={api_key}&query=*"
+            full_url = f"{base}&query=*"
         else:
-            params = urllib.parse.urlencode({
-                'apikey': api_key,
-                'query': query
-            })
-            full_url = f"{url.rstrip('/')}/api/v1/search?{params}"
+            full_url = f"{base}&query={urllib.parse.quote_plus(query)}"
         
         if os.environ.get('TORRENT_DEBUG'):
             print(f"DEBUG: Fetching from Prowlarr: {full_url}", file=sys.stderr)
@@ -145,7 +247,7 @@ def fetch_prowlarr(url, api_key, query, limit=50):
         })
         
         with urllib.request.urlopen(req, timeout=15) as response:
-            data = json.loads(response.read().decode('utf-8'))
+            data = json.load(response)
         
         if not data:
             return []
@@ -192,27 +294,71 @@ def fetch_prowlarr(url, api_key, query, limit=50):
         print(f"Prowlarr error: {e}", file=sys.stderr)
         return []
 
-def enrich_with_posters(results, max_workers=5):
+def poster_workers():
+    """Worker count for poster lookups: I/O bound, so scale well past cpu_count"""
+    env = os.environ.get('TERMFLIX_POSTER_WORKERS', '')
+    try:
+        if int(env) > 0:
+            return int(env)
+    except ValueError:
+        pass
+    return min(20, (os.cpu_count() or 4) * 5)
+
+def enrich_with_posters(results, max_workers=None, query=None):
     """Fetch posters for results in parallel (limited to avoid slowdown)"""
     # Only fetch posters for first N items to avoid slowdown
     items_to_enrich = results[:20]
+    max_workers = max_workers or poster_workers()
     
-    def fetch_poster_for_result(result):
-        name, year = extract_movie_info(result['title'])
-        poster = fetch_yts_poster(name, year)
-        result['poster'] = poster
-        return result
+    # Many torrents share a movie: resolve each (name, year) only once
+    wanted = {}
+    for result in items_to_enrich:
+        if is_non_movie(result['title']):
+            result['poster'] = None
+            continue
+        wanted.setdefault(extract_movie_info(result['title']), []).append(result)
+    
+    # Resolve cached entries, then as many as possible from one batched YTS search
+    posters = {}
+    batch = None
+    for name, year in wanted:
+        if not name:
+            posters[(name, year)] = None
+            continue
+        cache_key = f"{name}_{year}"
+        if cache_key in _poster_cache:
+            posters[(name, year)] = _poster_cache[cache_key]
+            continue
+        hit, poster = _disk_cache_get(name, year)
+        if not hit:
+            if batch is None:
+                batch = fetch_yts_posters_batch(query)
+            poster = batch.get((name.lower(), year))
+            if not poster:
+                continue
+            _disk_cache_put(name, year, poster)
+        _poster_cache[cache_key] = poster
+        posters[(name, year)] = poster
     
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(fetch_poster_for_result, r): r for r in items_to_enrich}
-        for future in as_completed(futures, timeout=10):
-            try:
-                future.result()
-            except Exception:
-                pass
+    # Fall back to per-title lookups for anything the batch didn't cover
+    unresolved = [key for key in wanted if key not in posters]
+    if unresolved:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(fetch_yts_poster, *key): key for key in unresolved}
+            for future in as_completed(futures, timeout=10):
+                try:
+                    posters[futures[future]] = future.result()
+                except Exception:
+                    pass
+    
+    for key, group in wanted.items():
+        for result in group:
+            result['poster'] = posters.get(key)
     
     return results
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB')
+
 def format_size(size_bytes):
     """Convert bytes to human-readable format"""
     if not size_bytes or size_bytes == 0:
@@ -220,14 +366,11 @@ def format_size(size_bytes):
     
     size_bytes = int(size_bytes)
     
-    if size_bytes < 1024:
+    # Pick the unit from the bit length (each unit is 2^10 apart), capped at GB
+    unit = min(max(size_bytes.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    if unit == 0:
         return f"{size_bytes}B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.2f}KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / 1024 / 1024:.2f}MB"
-    else:
-        return f"{size_bytes / 1024 / 1024 / 1024:.2f}GB"
+    return f"{size_bytes / (1 << (10 * unit)):.2f}{_SIZE_UNITS[unit]}"
 
 def main():
     """Main CLI interface"""
@@ -239,7 +382,7 @@ def main():
     parser.add_argument('--url', required=True, help='Jackett/Prowlarr URL')
     parser.add_argument('--api-key', required=True, help='API key')
     parser.add_argument('--limit', type=int, default=50, help='Max results')
-    parser.add_argument('--no-posters', action='store_true', help='Skip poster fetching')
+    parser.add_argument('--no-posters', action='store_true', help='Skip poster fetching (or set TERMFLIX_NO_POSTERS=1)')
     
     args = parser.parse_args()
     
@@ -249,12 +392,14 @@ def main():
     else:
         results = fetch_prowlarr(args.url, args.api_key, args.query, args.limit)
     
-    # Enrich with posters (unless disabled)
-    if results and not args.no_posters:
-        results = enrich_with_posters(results)
+    # Enrich with posters (unless disabled by flag or environment)
+    no_posters = args.no_posters or os.environ.get('TERMFLIX_NO_POSTERS', '') not in ('', '0')
+    if results and not no_posters:
+        results = enrich_with_posters(results, query=args.query)
     
     # Output in termflix format: SOURCE|NAME|MAGNET|QUALITY(seeds)|SIZE|EXTRA|POSTER
     # group_results.py extracts seeds from quality field (field 3)
+    lines = []
     for result in results:
         # Skip results with no seeds
         seeds = result['seeders']
@@ -278,7 +423,11 @@ def main():
         if len(magnet) > 500:
             magnet = magnet[:500] + "..."
 
-        print(f"{source}|{title}|{magnet}|unknown|{seeds}|{result['size']}|N/A|{poster}")
+        lines.append(f"{source}|{title}|{magnet}|unknown|{seeds}|{result['size']}|N/A|{poster}")
+    
+    # Single write instead of one print (and syscall) per row
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
     
     return 0 if results else 1
 
@@ -11,6 +11,20 @@ import urllib.parse
 from html.parser import HTMLParser
 from html import unescape
 
+# Shared patterns (compiled once at import)
+_CONTAINER_SELECTOR_RE = re.compile(r'^(\w+)(?:\s+class="([^"]*))?$')
+_TR_SNIFF_RE = re.compile(r'<tr', re.IGNORECASE)
+_RESULT_SNIFF_RE = re.compile(r'class="result', re.IGNORECASE)
+_TR_RE = re.compile(r'<tr[^>]*>.*?</tr>', re.DOTALL | re.IGNORECASE)
+_RESULT_DIV_RE = re.compile(r'<div[^>]*class="[^"]*result[^"]*"[^>]*>.*?</div>', re.DOTALL | re.IGNORECASE)
+_DIV_RE = re.compile(r'<div[^>]*>.*?</div>', re.DOTALL | re.IGNORECASE)
+_MAGNET_RE = re.compile(r'(magnet:\?xt=urn:btih:[A-F0-9]{40}[^"\s<>]*)', re.IGNORECASE)
+_MAGNET_PREFIX = 'magnet:?xt=urn:btih:'
+_MAGNET_TAIL_RE = re.compile(r'[^"\s<>]*')
+_HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+_NUMBER_STRIP_RE = re.compile(r'[,\s]')
+_NUMBER_RE = re.compile(r'\d+')
+
 class GenericTorrentScraper:
     """
     Generic scraper that works with any torrent site by defining:
@@ -22,8 +36,32 @@ class GenericTorrentScraper:
     def __init__(self, config):
         self.mirror = config['mirror'].rstrip('/')
         self.search_endpoint = config['search_endpoint']
+        self.search_base = self.mirror + self.search_endpoint
         self.selectors = config['selectors']
         self.name = config.get('name', 'Unknown')
+        self.block_pattern = self.compile_container(self.selectors['result_container'])
+        # Field patterns compiled once per scraper, not per block
+        self.field_patterns = {
+            pattern: re.compile(pattern, re.IGNORECASE | re.DOTALL)
+            for field, pattern in self.selectors.items()
+            if field != 'result_container' and pattern and pattern != 'magnet:'
+        }
+    
+    @staticmethod
+    def compile_container(selector):
+        """
+        Compile a container selector into a block regex.
+        Supports a bare tag ('tr') or a tag with a class prefix ('div class="browse-movie').
+        """
+        match = _CONTAINER_SELECTOR_RE.match(selector.strip())
+        if not match:
+            return None
+        tag, cls = match.group(1), match.group(2)
+        if cls:
+            opener = rf'<{tag}[^>]*class="[^"]*{re.escape(cls)}[^"]*"[^>]*>'
+        else:
+            opener = rf'<{tag}(?:\s[^>]*)?>'
+        return re.compile(rf'{opener}.*?</{tag}>', re.DOTALL | re.IGNORECASE)
     
     def search(self, query, limit=20):
         """Search for torrents and return results"""
@@ -33,13 +71,12 @@ class GenericTorrentScraper:
         if not html:
             return []
         
-        results = self.parse_results(html)
-        return results[:limit]
+        return self.parse_results(html, limit)
     
     def build_search_url(self, query):
         """Build search URL from query"""
         encoded_query = urllib.parse.quote_plus(query)
-        url = self.mirror + self.search_endpoint.replace('%s', encoded_query)
+        url = self.search_base.replace('%s', encoded_query)
         return url
     
     def fetch_url(self, url, timeout=10):
@@ -57,16 +94,13 @@ class GenericTorrentScraper:
             print(f"Error fetching {url}: {e}", file=sys.stderr)
             return None
     
-    def parse_results(self, html):
-        """Parse HTML and extract torrent results using selectors"""
+    def parse_results(self, html, limit=20):
+        """Parse HTML and extract up to `limit` torrent results using selectors"""
         results = []
         
-        # Simple regex-based selector parsing (not full CSS, but works for most cases)
-        container_selector = self.selectors['result_container']
-        
-        # Extract result blocks using regex
-        # This is a simplified approach - for production, use BeautifulSoup
-        result_blocks = self.extract_blocks(html, container_selector)
+        # Simple regex-based selector parsing (not full CSS, but works for most cases):
+        # extract result blocks using the container pattern compiled in __init__
+        result_blocks = self.extract_blocks(html)
         
         for block in result_blocks:
             try:
@@ -87,27 +121,35 @@ class GenericTorrentScraper:
                     result['size'] = result['size'].strip() if result['size'] else 'N/A'
                     
                     results.append(result)
+                    if len(results) >= limit:
+                        break
             except Exception as e:
                 # Skip malformed results
                 continue
         
         return results
     
-    def extract_blocks(self, html, selector):
-        """Extract result blocks from HTML"""
-        # Simplified: split by common row patterns
+    def extract_blocks(self, html, max_blocks=100):
+        """Lazily yield result blocks from HTML (stops as soon as the caller does)"""
+        # Prefer the site's declared container
+        pattern = None
+        if self.block_pattern and self.block_pattern.search(html):
+            pattern = self.block_pattern
+        # Fallback: sniff common row patterns
         # For <tr>, <div class="result">, etc.
-        
-        if '<tr' in html.lower():
+        elif _TR_SNIFF_RE.search(html):
             # Table-based results
-            blocks = re.findall(r'<tr[^>]*>.*?</tr>', html, re.DOTALL | re.IGNORECASE)
-        elif 'class="result' in html.lower():
-            blocks = re.findall(r'<div[^>]*class="[^"]*result[^"]*"[^>]*>.*?</div>', html, re.DOTALL | re.IGNORECASE)
+            pattern = _TR_RE
+        elif _RESULT_SNIFF_RE.search(html):
+            pattern = _RESULT_DIV_RE
         else:
             # Fallback: try to find repeating patterns
-            blocks = re.findall(r'<div[^>]*>.*?</div>', html, re.DOTALL | re.IGNORECASE)
+            pattern = _DIV_RE
         
-        return blocks[:100]  # Limit to first 100 blocks
+        for count, match in enumerate(pattern.finditer(html)):
+            if count >= max_blocks:
+                break
+            yield match.group(0)
     
     def extract_field(self, html_block, pattern):
         """Extract field from HTML block using pattern"""
@@ -120,25 +162,41 @@ class GenericTorrentScraper:
         # - '>([^<]+)<' for text content
         
         if pattern == 'magnet:':
-            # Extract magnet link
-            match = re.search(r'(magnet:\?xt=urn:btih:[A-F0-9]{40}[^"\s<>]*)', html_block, re.IGNORECASE)
-            return match.group(1) if match else ''
+            return self.extract_magnet(html_block)
         
         # Generic pattern matching
-        match = re.search(pattern, html_block, re.IGNORECASE | re.DOTALL)
+        compiled = self.field_patterns.get(pattern)
+        if compiled is None:
+            compiled = self.field_patterns[pattern] = re.compile(pattern, re.IGNORECASE | re.DOTALL)
+        match = compiled.search(html_block)
         if match:
             return match.group(1) if match.groups() else match.group(0)
         
         return ''
     
+    @staticmethod
+    def extract_magnet(html_block):
+        """Extract the first magnet link, using a plain substring scan when possible"""
+        # Case-insensitive like _MAGNET_RE, so both find the same leftmost link;
+        # lower() keeps indices only for ASCII text
+        start = html_block.lower().find(_MAGNET_PREFIX) if html_block.isascii() else -1
+        if start != -1:
+            hash_end = start + len(_MAGNET_PREFIX) + 40
+            if hash_end <= len(html_block) and _HEX_DIGITS.issuperset(html_block[hash_end - 40:hash_end]):
+                return html_block[start:_MAGNET_TAIL_RE.match(html_block, hash_end).end()]
+        
+        # Unusual casing or a malformed first hash: let the regex sort it out
+        match = _MAGNET_RE.search(html_block)
+        return match.group(1) if match else ''
+    
     def parse_number(self, value):
         """Parse number from string (handles '1,234' format)"""
         if not value:
             return 0
         
         # Remove commas and extract first number
-        cleaned = re.sub(r'[,\s]', '', str(value))
-        match = re.search(r'\d+', cleaned)
+        cleaned = _NUMBER_STRIP_RE.sub('', str(value))
+        match = _NUMBER_RE.search(cleaned)
         return int(match.group(0)) if match else 0
 
 
@@ -205,8 +263,11 @@ def main():
     results = scraper.search(args.query, args.limit)
     
     # Output in termflix format: SOURCE|NAME|MAGNET|QUALITY|SIZE|SEEDS|POSTER
-    for result in results:
-        print(f"{config['name']}|{result['title']}|{result['magnet']}|N/A|{result['size']}|{result['seeders']}|N/A")
+    if results:
+        sys.stdout.write(''.join(
+            f"{config['name']}|{result['title']}|{result['magnet']}|N/A|{result['size']}|{result['seeders']}|N/A\n"
+            for result in results
+        ))
     
     return 0 if results else 1
 
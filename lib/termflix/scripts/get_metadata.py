@@ -5,6 +5,9 @@ Fetches movie metadata (Year, Runtime, Genre, Rating, Plot) with fallback chain:
 1. OMDb (API Key - Best quality)
 2. TMDB (API Key - Good quality)
 3. YTS (Public API - Good backup for torrent movies)
+4. Google scrape (last resort)
+
+Providers 1-3 are queried concurrently; the highest-priority hit wins.
 
 Output: JSON object normalized to OMDb format.
 """
@@ -15,6 +18,10 @@ import urllib.request
 import urllib.parse
 import re
 import ssl
+import sqlite3
+import time
+import functools
+import threading
 from pathlib import Path
 
 # Shared SSL context
@@ -22,6 +29,10 @@ _SSL_CTX = ssl.create_default_context()
 _SSL_CTX.check_hostname = False
 _SSL_CTX.verify_mode = ssl.CERT_NONE
 
+# Shared opener: handler chain built once instead of per urlopen() call
+_opener = urllib.request.build_opener(urllib.request.HTTPSHandler(context=_SSL_CTX))
+_opener.addheaders = [('User-Agent', 'Termflix/1.0')]
+
 # Load API keys from config file
 _config = {}
 def load_config():
@@ -41,13 +52,88 @@ def load_config():
 def get_api_key(name):
     return load_config().get(name) or os.environ.get(name)
 
+# Response cache (metadata practically never changes, misses are retried sooner)
+METADATA_DB = Path.home() / ".cache" / "termflix" / "metadata.sqlite"
+METADATA_TTL = 30 * 24 * 60 * 60  # 30 days for hits
+METADATA_NULL_TTL = 60 * 60       # 1 hour for misses
+_db = None
+_db_lock = threading.Lock()
+
+def _metadata_db():
+    global _db
+    if _db is None:
+        METADATA_DB.parent.mkdir(parents=True, exist_ok=True)
+        _db = sqlite3.connect(str(METADATA_DB), timeout=5, check_same_thread=False)
+        _db.execute('PRAGMA journal_mode=WAL')
+        _db.execute(
+            'CREATE TABLE IF NOT EXISTS metadata ('
+            'source TEXT NOT NULL, title TEXT NOT NULL, year TEXT NOT NULL, '
+            'data TEXT, fetched_at REAL NOT NULL, PRIMARY KEY (source, title, year))'
+        )
+    return _db
+
+def cached(source, api_key=None, ttl=METADATA_TTL, null_ttl=METADATA_NULL_TTL):
+    """
+    Cache a fetch_*(title, year) result on disk, keyed by (source, title, year).
+    fetch returns None for a definite not-found and raises on network/provider
+    errors; only the former is recorded as a miss.
+    """
+    def decorator(fetch):
+        def lookup(title, year):
+            """(True, result) if the answer is known without a request, else (False, None)"""
+            # Don't record misses for providers that aren't configured
+            if api_key and not get_api_key(api_key): return True, None
+            key = (source, title.lower(), year or '')
+            try:
+                with _db_lock:
+                    row = _metadata_db().execute(
+                        'SELECT data, fetched_at FROM metadata WHERE source = ? AND title = ? AND year = ?', key
+                    ).fetchone()
+                if row and time.time() - row[1] < (ttl if row[0] else null_ttl):
+                    return True, (json.loads(row[0]) if row[0] else None)
+            except (sqlite3.Error, ValueError): pass
+            return False, None
+
+        @functools.wraps(fetch)
+        def wrapper(title, year):
+            known, res = lookup(title, year)
+            if known: return res
+            key = (source, title.lower(), year or '')
+            try:
+                res = fetch(title, year)
+            except Exception:
+                # Timeouts, DNS failures and 5xx say nothing about the title
+                return None
+            try:
+                with _db_lock:
+                    db = _metadata_db()
+                    db.execute(
+                        'INSERT OR REPLACE INTO metadata (source, title, year, data, fetched_at) VALUES (?, ?, ?, ?, ?)',
+                        key + (json.dumps(res) if res else None, time.time())
+                    )
+                    db.commit()
+            except sqlite3.Error: pass
+            return res
+        wrapper.lookup = lookup
+        return wrapper
+    return decorator
+
+# Parsing patterns
+_TITLE_YEAR_RE = re.compile(r'^(.*?)\s*\((\d{4})\)$')
+_RATING_RE = re.compile(r'(\d+(?:\.\d+)?)\s*/\s*10')
+_RUNTIME_RE = re.compile(r'(\d+h\s*\d+m)|(\d+\s*min)')
+_GENRES_RE = re.compile(
+    r'\b(Action|Adventure|Sci-Fi|Drama|Comedy|Thriller|Horror|Romance|Fantasy|'
+    r'Animation|Crime|Mystery|Biography|History)\b'
+)
+
 def clean_title_and_year(full_input):
     """Parse title and year from input string 'Title (Year)' or just 'Title'"""
     title = full_input
     year = None
     
     # Check for (Year) at end
-    match = re.search(r'^(.*?)\s*\((\d{4})\)$', full_input)
+    match = _TITLE_YEAR_RE.search(full_input)
     if match:
         title = match.group(1)
         year = match.group(2)
@@ -83,6 +169,7 @@ def normalize_response(source, data):
         
     return res
 
+@cached('OMDB', api_key='OMDB_API_KEY')
 def fetch_omdb(title, year):
     api_key = get_api_key('OMDB_API_KEY')
     if not api_key: return None
@@ -91,14 +178,13 @@ def fetch_omdb(title, year):
     if year: query['y'] = year
     
     url = f"http://www.omdbapi.com/?{urllib.parse.urlencode(query)}"
-    try:
-        with urllib.request.urlopen(url, timeout=5, context=_SSL_CTX) as response:
-            data = json.load(response)
-            if data.get('Response') == 'True':
-                return normalize_response('OMDB', data)
-    except: pass
+    with _opener.open(url, timeout=5) as response:
+        data = json.load(response)
+    if data.get('Response') == 'True':
+        return normalize_response('OMDB', data)
     return None
 
+@cached('TMDB', api_key='TMDB_API_KEY')
 def fetch_tmdb(title, year):
     api_key = get_api_key('TMDB_API_KEY')
     if not api_key: return None
@@ -107,42 +193,74 @@ def fetch_tmdb(title, year):
     search_url = f"https://api.themoviedb.org/3/search/movie?api_key={api_key}&query={urllib.parse.quote(title)}"
     if year: search_url += f"&year={year}"
     
-    try:
-        with urllib.request.urlopen(search_url, timeout=5, context=_SSL_CTX) as response:
-            search_res = json.load(response)
-            if search_res.get('results'):
-                movie_id = search_res['results'][0]['id']
-                # 2. Get Details
-                details_url = f"https://api.themoviedb.org/3/movie/{movie_id}?api_key={api_key}"
-                with urllib.request.urlopen(details_url, timeout=5, context=_SSL_CTX) as det_response:
-                    data = json.load(det_response)
-                    return normalize_response('TMDB', data)
-    except: pass
-    return None
+    with _opener.open(search_url, timeout=5) as response:
+        search_res = json.load(response)
+    if not search_res.get('results'):
+        return None
+    movie_id = search_res['results'][0]['id']
+    
+    # 2. Get Details
+    details_url = f"https://api.themoviedb.org/3/movie/{movie_id}?api_key={api_key}"
+    with _opener.open(details_url, timeout=5) as det_response:
+        data = json.load(det_response)
+    return normalize_response('TMDB', data)
 
+@cached('YTS')
 def fetch_yts(title, year):
     # Public API - No key needed!
     query = {'query_term': title} # YTS search is fuzzy
     url = f"https://yts.mx/api/v2/list_movies.json?{urllib.parse.urlencode(query)}"
     
-    try:
-        with urllib.request.urlopen(url, timeout=8, context=_SSL_CTX) as response:
-            data = json.load(response)
-            if data.get('data') and data['data'].get('movies'):
-                # Filter by year if possible (YTS search is broad)
-                movies = data['data']['movies']
-                best_match = movies[0]
+    with _opener.open(url, timeout=8) as response:
+        data = json.load(response)
+    if not (data.get('data') and data['data'].get('movies')):
+        return None
+    
+    # Filter by year if possible (YTS search is broad)
+    movies = data['data']['movies']
+    best_match = movies[0]
+    
+    if year:
+        for m in movies:
+            if str(m.get('year')) == str(year):
+                best_match = m
+                break
                 
-                if year:
-                    for m in movies:
-                        if str(m.get('year')) == str(year):
-                            best_match = m
-                            break
-                            
-                return normalize_response('YTS', best_match)
-    except: pass
+    return normalize_response('YTS', best_match)
+
+GOOGLE_HEAD_BYTES = 64 * 1024  # Knowledge panel sits near the top of the page
+
+def parse_google_snippet(html_content, year):
+    """Extract rating/runtime/genre from Google SERP HTML"""
+    res = {
+        'Year': year or '', 'Runtime': '', 'Genre': '', 'imdbRating': '', 
+        'Plot': '', 'Response': 'True', 'Source': 'Google-Scrape'
+    }
+    
+    # Robust Rating Regex
+    # Matches: 8.7/10, 8.7 / 10, 8.7 out of 10
+    rating_match = _RATING_RE.search(html_content)
+    if rating_match:
+        res['imdbRating'] = f"{rating_match.group(1)}/10"
+        
+    # Runtime Regex
+    # Matches: 2h 16m, 2h 16min, 136 min
+    runtime_match = _RUNTIME_RE.search(html_content)
+    if runtime_match:
+        res['Runtime'] = runtime_match.group(0)
+    
+    # Genre (single scan, first-seen order)
+    found_genres = list(dict.fromkeys(_GENRES_RE.findall(html_content)))
+    if found_genres:
+        res['Genre'] = ", ".join(found_genres[:3])
+        
+    # Plot? (Hard to robustly scrape without clear markers)
+    
+    if res['imdbRating'] or res['Runtime']:
+        return res
     return None
 
+@cached('Google')
 def fetch_google_metadata(title, year):
     """Scrape Google Search results for IMDB snippet"""
     query = f"{title} {year or ''} imdb"
@@ -152,48 +270,52 @@ def fetch_google_metadata(title, year):
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
     }
     
-    try:
-        req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req, timeout=5, context=_SSL_CTX) as response:
-            html_content = response.read().decode('utf-8', errors='ignore')
-            
-            res = {
-                'Year': year or '', 'Runtime': '', 'Genre': '', 'imdbRating': '', 
-                'Plot': '', 'Response': 'True', 'Source': 'Google-Scrape'
-            }
-            
-            # Robust Rating Regex
-            # Matches: 8.7/10, 8.7 / 10, 8.7 out of 10
-            rating_match = re.search(r'(\d+(?:\.\d+)?)\s*/\s*10', html_content)
-            if rating_match:
-                res['imdbRating'] = f"{rating_match.group(1)}/10"
-                
-            # Runtime Regex
-            # Matches: 2h 16m, 2h 16min, 136 min
-            runtime_match = re.search(r'(\d+h\s*\d+m)|(\d+\s*min)', html_content)
-            if runtime_match:
-                res['Runtime'] = runtime_match.group(0)
-            
-            # Genre
-            common_genres = ['Action', 'Adventure', 'Sci-Fi', 'Drama', 'Comedy', 'Thriller', 'Horror', 'Romance', 'Fantasy', 'Animation', 'Crime', 'Mystery', 'Biography', 'History']
-            found_genres = []
-            for g in common_genres:
-                if re.search(rf'\b{g}\b', html_content):
-                    found_genres.append(g)
-            if found_genres:
-                # Deduplicate and limit
-                seen = set()
-                deduped = [x for x in found_genres if not (x in seen or seen.add(x))]
-                res['Genre'] = ", ".join(deduped[:3])
-                
-            # Plot? (Hard to robustly scrape without clear markers)
-            
-            if res['imdbRating'] or res['Runtime']:
-                return res
-            
-    except Exception as e:
-        # Fail silently but could log if needed
-        pass
+    req = urllib.request.Request(url, headers=headers)
+    with _opener.open(req, timeout=5) as response:
+        # Cheap path: only scan the head of the page
+        head = response.read(GOOGLE_HEAD_BYTES)
+        res = parse_google_snippet(head.decode('utf-8', errors='ignore'), year)
+        if res:
+            return res
+        
+        # Fallback: scan the whole document
+        rest = response.read()
+        if rest:
+            return parse_google_snippet((head + rest).decode('utf-8', errors='ignore'), year)
+    return None
+
+def race_providers(title, year, providers):
+    """
+    Return the first non-empty result in priority order. Cached answers are
+    read up front; only providers the cache can't answer are queried, all
+    concurrently, so worst case is the slowest one rather than the sum.
+    Daemon threads let the process exit without waiting on losing requests.
+    """
+    results = []
+    done = []
+
+    def run(i, fetch):
+        try:
+            results[i] = fetch(title, year)
+        except Exception: pass
+        finally:
+            done[i].set()
+
+    for fetch in providers:
+        known, res = fetch.lookup(title, year)
+        results.append(res)
+        done.append(threading.Event())
+        if known:
+            done[-1].set()
+            if res:
+                break  # Lower-priority providers can't beat a cached hit
+        else:
+            threading.Thread(target=run, args=(len(done) - 1, fetch), daemon=True).start()
+
+    for i, event in enumerate(done):
+        event.wait()
+        if results[i]:
+            return results[i]
     return None
 
 def main():
@@ -204,26 +326,14 @@ def main():
     full_input = sys.argv[1]
     title, year = clean_title_and_year(full_input)
     
-    # Prioritized Fallback Chain
-    # 1. OMDB
-    res = fetch_omdb(title, year)
-    if res:
-        print(json.dumps(res))
-        return
-        
-    # 2. TMDB
-    res = fetch_tmdb(title, year)
-    if res:
-        print(json.dumps(res))
-        return
-        
-    # 3. YTS (Public)
-    res = fetch_yts(title, year)
+    # Prioritized providers raced in parallel: best source that answers wins
+    load_config()
+    res = race_providers(title, year, (fetch_omdb, fetch_tmdb, fetch_yts))
     if res:
         print(json.dumps(res))
         return
 
-    # 4. Google Scrape (IMDB Snippet)
+    # Last resort: Google Scrape (IMDB Snippet)
     res = fetch_google_metadata(title, year)
     if res:
         print(json.dumps(res))
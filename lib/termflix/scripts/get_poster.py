@@ -7,7 +7,7 @@ Fetches movie poster URL with fallback chain:
 3. TMDB (API Key)
 4. Google Images (Scrape)
 
-OPTIMIZED: Pre-compiled regex, parallel fallback with ThreadPoolExecutor
+OPTIMIZED: Pre-compiled regex, APIs raced in daemon threads (first hit wins)
 """
 import sys
 import os
@@ -17,8 +17,11 @@ import urllib.parse
 import re
 import ssl
 import html
+import queue
+import sqlite3
+import threading
+import time
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Pre-compiled regex patterns
 _CLEAN_TITLE_RE = re.compile(r'\(\d{4}\)')
@@ -32,27 +35,80 @@ _SSL_CTX = ssl.create_default_context()
 _SSL_CTX.check_hostname = False
 _SSL_CTX.verify_mode = ssl.CERT_NONE
 
-# Load API keys from config file
-_config = {}
+# Shared opener for the JSON APIs (handler chain built once, default UA preset)
+_opener = urllib.request.build_opener()
+_opener.addheaders = [('User-Agent', 'Mozilla/5.0')]
+
+# Load API keys from config file (parsed at most once per process, and
+# only on a poster cache miss - see main)
+_config = None
 def load_config():
     global _config
-    if _config:
+    if _config is not None:
         return _config
     
+    _config = {}
     config_path = Path.home() / ".config" / "termflix" / "config"
-    if config_path.exists():
-        try:
-            with open(config_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if '=' in line and not line.startswith('#'):
-                        key, value = line.split('=', 1)
-                        _config[key.strip()] = value.strip().strip('"\'')
-        except Exception:
-            pass
+    try:
+        text = config_path.read_text()
+    except Exception:
+        return _config
+    for line in text.splitlines():
+        line = line.strip()
+        if '=' in line and not line.startswith('#'):
+            key, value = line.split('=', 1)
+            _config[key.strip()] = value.strip().strip('"\'')
     return _config
 
 
+# Resolved poster URLs, keyed by (clean title, year); failures are never stored
+POSTER_DB = Path.home() / ".cache" / "termflix" / "posters.sqlite"
+POSTER_TTL = 7 * 24 * 60 * 60  # 7 days
+_db = None
+
+
+def _poster_db():
+    global _db
+    if _db is None:
+        POSTER_DB.parent.mkdir(parents=True, exist_ok=True)
+        _db = sqlite3.connect(str(POSTER_DB), timeout=2)
+        _db.execute('PRAGMA journal_mode=WAL')
+        _db.execute('PRAGMA synchronous=NORMAL')
+        _db.execute(
+            'CREATE TABLE IF NOT EXISTS posters ('
+            'title TEXT NOT NULL, year TEXT NOT NULL, url TEXT NOT NULL, fetched_at REAL NOT NULL, '
+            'PRIMARY KEY (title, year))'
+        )
+    return _db
+
+
+def cache_get(title, year):
+    """Return a cached poster URL if present and fresh"""
+    try:
+        with _poster_db() as db:
+            row = db.execute(
+                'SELECT url, fetched_at FROM posters WHERE title = ? AND year = ?',
+                (title.lower(), year or '')
+            ).fetchone()
+        if row and time.time() - row[1] < POSTER_TTL:
+            return row[0]
+    except sqlite3.Error:
+        pass
+    return None
+
+
+def cache_put(title, year, url):
+    """Store a successfully resolved poster URL"""
+    try:
+        with _poster_db() as db:
+            db.execute(
+                'INSERT OR REPLACE INTO posters (title, year, url, fetched_at) VALUES (?, ?, ?, ?)',
+                (title.lower(), year or '', url, time.time())
+            )
+    except sqlite3.Error:
+        pass
+
+
 def get_api_key(name):
     """Get API key from config file or environment variable"""
     config = load_config()
@@ -87,8 +143,7 @@ def fetch_omdb(query, year, api_key):
         if year:
             url += f"&y={year}"
             
-        req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-        with urllib.request.urlopen(req, timeout=3) as response:
+        with _opener.open(url, timeout=3) as response:
             data = json.loads(response.read().decode())
             if data.get('Response') == 'True' and data.get('Poster') and data['Poster'] != 'N/A':
                 return data['Poster']
@@ -101,8 +156,7 @@ def fetch_yts(query):
     """Fetch poster from YTS (YTS API doesn't support year filtering well in query_term)"""
     try:
         url = f"https://yts.mx/api/v2/list_movies.json?query_term={urllib.parse.quote(query)}&limit=1"
-        req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-        with urllib.request.urlopen(req, timeout=10) as response:
+        with _opener.open(url, timeout=10) as response:
             data = json.loads(response.read().decode())
             if data.get('status') == 'ok' and data['data'].get('movie_count', 0) > 0:
                 movie = data['data']['movies'][0]
@@ -119,8 +173,7 @@ def fetch_tmdb(query, year, api_key):
         if year:
             url += f"&year={year}"
             
-        req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-        with urllib.request.urlopen(req, timeout=3) as response:
+        with _opener.open(url, timeout=3) as response:
             data = json.loads(response.read().decode())
             if data.get('results'):
                 for res in data['results']:
@@ -191,6 +244,37 @@ def fetch_google(query, year=None):
     return None
 
 
+API_DEADLINE = 5  # seconds to wait on the API race before falling back to Google
+
+
+def first_result(calls, deadline=API_DEADLINE):
+    """
+    Run (func, *args) calls concurrently and return the first truthy result.
+    Threads are daemons, so returning (and exiting) never waits on slower APIs;
+    `deadline` bounds the whole race so one hung API can't stall the fallback.
+    """
+    results = queue.Queue()
+    
+    def run(func, *args):
+        try:
+            results.put(func(*args))
+        except Exception:
+            results.put(None)
+    
+    for call in calls:
+        threading.Thread(target=run, args=call, daemon=True).start()
+    
+    end = time.monotonic() + deadline
+    for _ in calls:
+        try:
+            result = results.get(timeout=max(end - time.monotonic(), 0))
+        except queue.Empty:
+            break
+        if result:
+            return result
+    return None
+
+
 def main():
     if len(sys.argv) < 2:
         return
@@ -198,36 +282,35 @@ def main():
     raw_query = sys.argv[1]
     query, year = clean_title_and_year(raw_query)
     
+    poster = cache_get(query, year)
+    if poster:
+        print(poster)
+        return
+    
     omdb_key = get_api_key('OMDB_API_KEY')
     tmdb_key = get_api_key('TMDB_API_KEY')
     
     # OPTIMIZATION: Try APIs in parallel
     # Only Google is excluded from parallel (it's a fallback)
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        futures = {}
-        
-        if omdb_key:
-            futures[executor.submit(fetch_omdb, query, year, omdb_key)] = 'omdb'
-        
-        # YTS works best with the exact original search term from the tracker usually
-        futures[executor.submit(fetch_yts, raw_query)] = 'yts'
-        
-        if tmdb_key:
-            futures[executor.submit(fetch_tmdb, query, year, tmdb_key)] = 'tmdb'
-        
-        # Return first successful result
-        for future in as_completed(futures):
-            try:
-                result = future.result()
-                if result:
-                    print(result)
-                    return
-            except Exception:
-                pass
+    calls = []
+    if omdb_key:
+        calls.append((fetch_omdb, query, year, omdb_key))
+    
+    # YTS works best with the exact original search term from the tracker usually
+    calls.append((fetch_yts, raw_query))
+    
+    if tmdb_key:
+        calls.append((fetch_tmdb, query, year, tmdb_key))
+    
+    # Return first successful result
+    poster = first_result(calls)
     
     # Fallback to Google (slower, so done separately)
-    poster = fetch_google(query, year)
+    if not poster:
+        poster = fetch_google(query, year)
+    
     if poster:
+        cache_put(query, year, poster)
         print(poster)
         return
     
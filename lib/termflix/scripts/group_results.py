@@ -13,12 +13,14 @@ Features:
 Input: Pipe-delimited torrent results from stdin
 Output: COMBINED entries to stdout
 """
+import os
 import sys
 import re
 import hashlib
-import base64
 from collections import defaultdict
-from typing import Dict, List, Set, Optional
+from functools import lru_cache
+from dataclasses import dataclass, field
+from typing import Dict, List, Set, Optional, Tuple
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -36,6 +38,18 @@ QUALITY_ORDER = {
     'Unknown': 99
 }
 
+# Substrings that identify each quality, in priority order (first hit wins)
+QUALITY_TOKENS = (
+    ('4K', ('2160p', '4k', 'uhd')),
+    ('1080p', ('1080p', '1080i', 'fhd')),
+    ('720p', ('720p', 'hd')),
+    ('480p', ('480p', 'sd')),
+    ('HDTV', ('hdtv',)),
+    ('CAM', ('cam',)),
+    ('TS', ('ts', 'telesync')),
+    ('TC', ('tc', 'telecine')),
+)
+
 # Tags to remove during normalization
 REMOVAL_TAGS = [
     # Quality
@@ -80,19 +94,86 @@ ROMAN_NUMERALS = {
 }
 
 
+# Tags only stripped by normalize_title (on top of REMOVAL_TAGS)
+EXTRA_NORMALIZE_TAGS = [
+    # Additional patterns often missed
+    'proper', 'real', 'limited', 'extended', 'ultimate', 'repack',
+    'criterion', 'uncut', 'final', 'complete', 'special', 'edition',
+    'rgb', 'bone', 'en', 'eng', 'hin', 'hindi', 'tamil',
+    'amzn', 'nf', 'hmax', 'dsnp', 'atvp', 'pcok', 'hulu',
+]
+
+# Hyphenated tags removed before separators are normalized
+HYPHEN_PATTERNS = [
+    r'web-dl', r'web-rip', r'blu-ray', r'hdr10?', r'dts-hd',
+    r'h-264', r'h-265', r'dd5-1', r'x-264', r'x-265',
+]
+
+# Inputs larger than this are parsed in worker processes (normalize_title is CPU-bound)
+PARALLEL_MIN_LINES = 5000
+
+
+# ═══════════════════════════════════════════════════════════════
+# COMPILED PATTERNS
+# ═══════════════════════════════════════════════════════════════
+
+_YEAR_PAREN_RE = re.compile(r'\((19[2-9]\d|20[0-2]\d)\)')
+_YEAR_BARE_RE = re.compile(r'(?:^|[\W_])(19[2-9]\d|20[0-2]\d)(?:$|[\W_])')
+_BTIH_HEX_RE = re.compile(r'btih:([a-fA-F0-9]{40})')
+_MAGNET_PREFIX = 'magnet:?xt=urn:btih:'
+_HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+_BTIH_B32_RE = re.compile(r'btih:([A-Z2-7]{32})', re.IGNORECASE)
+# RFC 4648 base32 alphabet -> int() base-32 digits, so decoding stays in C
+_B32_TO_INT_DIGITS = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ234567', '0123456789abcdefghijklmnopqrstuv')
+_DIGITS_RE = re.compile(r'(\d+)')
+_IMDB_ID_RE = re.compile(r'(tt\d{7,})')
+_ANY_YEAR_RE = re.compile(r'\d{4}')
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+
+# normalize_title pipeline
+_YEAR_OPT_PAREN_RE = re.compile(r'\(?(19[2-9]\d|20[0-2]\d)\)?')
+_YEAR_WORD_RE = re.compile(r'\b(19[2-9]\d|20[0-2]\d)\b')
+_BRACKET_RE = re.compile(r'\[.*?\]')
+_PAREN_RE = re.compile(r'\(.*?\)')
+_HYPHEN_RE = re.compile('|'.join(HYPHEN_PATTERNS), re.IGNORECASE)
+_SEP_TABLE = str.maketrans('._-+', '    ')
+_THE_PREFIX_RE = re.compile(r'^the\s+')
+_THE_SUFFIX_RE = re.compile(r',\s*the\s*$')
+# Tag stripping as a multi-pattern scan: separators are spaces by then, so
+# every single-word tag is a whole \w-run and a set lookup per word replaces
+# a ~190-way regex alternation. Multi-word tags get a small alternation first.
+_ALL_TAGS = set(REMOVAL_TAGS + EXTRA_NORMALIZE_TAGS)
+_WORD_TAGS = frozenset(tag for tag in _ALL_TAGS if re.fullmatch(r'\w+', tag))
+_PHRASE_TAGS_RE = re.compile(
+    r'\b(?:' + '|'.join(
+        re.escape(tag) for tag in sorted((t for t in _ALL_TAGS if ' ' in t), key=len, reverse=True)
+    ) + r')\b'
+)
+_WORD_SPLIT_RE = re.compile(r'(\W+)')
+_VERSION_RE = re.compile(r'\bv\d+\b', re.IGNORECASE)
+_TRAILING_SHORT_RE = re.compile(r'\s+[a-z]{1,5}$')
+# Longest numerals first; \b on both sides means only whole words are replaced
+_ROMAN_RE = re.compile(r'\b(' + '|'.join(sorted(ROMAN_NUMERALS, key=len, reverse=True)) + r')\b')
+# ASCII lookup table for step 12 (non-ASCII is dropped by encode first)
+_DROP_NON_ALNUM_TABLE = {
+    c: None for c in range(128) if not (chr(c).isdigit() or 'a' <= chr(c) <= 'z' or c == 32)
+}
+
+
 # ═══════════════════════════════════════════════════════════════
 # EXTRACTION FUNCTIONS
 # ═══════════════════════════════════════════════════════════════
 
+@lru_cache(maxsize=8192)
 def extract_year(name: str) -> str:
     """Extract year (1920-2029) from torrent name."""
     # Try parens first: (2024)
-    match = re.search(r'\((19[2-9]\d|20[0-2]\d)\)', name)
+    match = _YEAR_PAREN_RE.search(name)
     if match:
         return match.group(1)
     
     # Try 4 digits surrounded by non-alnum
-    match = re.search(r'(?:^|[\W_])(19[2-9]\d|20[0-2]\d)(?:$|[\W_])', name)
+    match = _YEAR_BARE_RE.search(name)
     if match:
         return match.group(1)
     
@@ -104,57 +185,49 @@ def extract_info_hash(magnet: str) -> str:
     if not magnet:
         return ""
     
+    # Fast path: well-formed magnet with the hex hash right after the prefix
+    if magnet.startswith(_MAGNET_PREFIX):
+        candidate = magnet[20:60]
+        if len(candidate) == 40 and _HEX_DIGITS.issuperset(candidate):
+            return candidate.lower()
+    
     # Hex hash (40 chars)
-    match = re.search(r'btih:([a-fA-F0-9]{40})', magnet)
+    match = _BTIH_HEX_RE.search(magnet)
     if match:
         return match.group(1).lower()
     
-    # Base32 hash (32 chars) - convert to hex
-    match = re.search(r'btih:([A-Z2-7]{32})', magnet, re.IGNORECASE)
+    # Base32 hash (32 chars = 160 bits) - convert to 40 hex chars
+    match = _BTIH_B32_RE.search(magnet)
     if match:
-        try:
-            hash_bytes = base64.b32decode(match.group(1).upper())
-            return hash_bytes.hex().lower()
-        except Exception:
-            pass
+        digits = match.group(1).upper().translate(_B32_TO_INT_DIGITS)
+        return format(int(digits, 32), '040x')
     
     return ""
 
 
+@lru_cache(maxsize=8192)
 def extract_quality(name: str) -> str:
     """Extract quality from torrent name."""
     name_lower = name.lower()
     
     # Check quality patterns (order matters)
-    if any(q in name_lower for q in ['2160p', '4k', 'uhd']):
-        return '4K'
-    if any(q in name_lower for q in ['1080p', '1080i', 'fhd']):
-        return '1080p'
-    if any(q in name_lower for q in ['720p', 'hd']):
-        return '720p'
-    if '480p' in name_lower or 'sd' in name_lower:
-        return '480p'
-    if 'hdtv' in name_lower:
-        return 'HDTV'
-    if 'cam' in name_lower:
-        return 'CAM'
-    if any(q in name_lower for q in ['ts', 'telesync']):
-        return 'TS'
-    if any(q in name_lower for q in ['tc', 'telecine']):
-        return 'TC'
+    for quality, tokens in QUALITY_TOKENS:
+        for token in tokens:
+            if token in name_lower:
+                return quality
     
     return 'Unknown'
 
 
 def extract_seeds(text: str) -> int:
     """Extract seed count from text."""
-    match = re.search(r'(\d+)', str(text))
+    match = _DIGITS_RE.search(str(text))
     return int(match.group(1)) if match else 0
 
 
 def extract_imdb_id(line: str) -> str:
     """Extract IMDB ID from result line if present."""
-    match = re.search(r'(tt\d{7,})', line)
+    match = _IMDB_ID_RE.search(line)
     return match.group(1) if match else ""
 
 
@@ -162,6 +235,16 @@ def extract_imdb_id(line: str) -> str:
 # NORMALIZATION
 # ═══════════════════════════════════════════════════════════════
 
+def strip_tags(text: str) -> str:
+    """Remove known tags from lowercased, space-separated text."""
+    text = _PHRASE_TAGS_RE.sub('', text)
+    parts = _WORD_SPLIT_RE.split(text)
+    # Even indexes are words, odd indexes the separators between them
+    parts[::2] = ['' if word in _WORD_TAGS else word for word in parts[::2]]
+    return ''.join(parts)
+
+
+@lru_cache(maxsize=8192)
 def normalize_title(title: str, year: str = "") -> str:
     """
     Normalize title for grouping purposes.
@@ -174,61 +257,47 @@ def normalize_title(title: str, year: str = "") -> str:
     t = title.strip()
     
     # 1. Handle year in parentheses first - extract and remove
-    year_match = re.search(r'\(?(19[2-9]\d|20[0-2]\d)\)?', t)
+    year_match = _YEAR_OPT_PAREN_RE.search(t)
     extracted_year = year_match.group(1) if year_match else year
     
     # 2. Remove everything in brackets/parens (often contains garbage)
-    t = re.sub(r'\[.*?\]', '', t)
-    t = re.sub(r'\(.*?\)', '', t)
+    t = _BRACKET_RE.sub('', t)
+    t = _PAREN_RE.sub('', t)
     
     # 3. Remove year from title if found
     if extracted_year:
-        t = re.sub(rf'\b{extracted_year}\b', '', t)
+        t = _YEAR_WORD_RE.sub(lambda m: '' if m.group(1) == extracted_year else m.group(0), t)
     
     # 4. Remove common hyphenated patterns first
-    hyphen_patterns = [
-        r'web-dl', r'web-rip', r'blu-ray', r'hdr10?', r'dts-hd',
-        r'h-264', r'h-265', r'dd5-1', r'x-264', r'x-265',
-    ]
-    for pat in hyphen_patterns:
-        t = re.sub(pat, '', t, flags=re.IGNORECASE)
+    t = _HYPHEN_RE.sub('', t)
     
     # 5. Convert separators to spaces
-    t = re.sub(r'[._\-\+]', ' ', t)
+    t = t.translate(_SEP_TABLE)
     
     # 6. Lowercase for comparison
     t = t.lower()
     
     # 7. Handle "The " prefix and ", The" suffix
-    t = re.sub(r'^the\s+', '', t)
-    t = re.sub(r',\s*the\s*$', '', t)
-    
-    # 8. Remove ALL known tags (extended list)
-    all_tags = REMOVAL_TAGS + [
-        # Additional patterns often missed
-        'proper', 'real', 'limited', 'extended', 'ultimate', 'repack',
-        'criterion', 'uncut', 'final', 'complete', 'special', 'edition',
-        'rgb', 'bone', 'en', 'eng', 'hin', 'hindi', 'tamil',
-        'amzn', 'nf', 'hmax', 'dsnp', 'atvp', 'pcok', 'hulu',
-    ]
-    for tag in all_tags:
-        t = re.sub(r'\b' + re.escape(tag) + r'\b', '', t, flags=re.IGNORECASE)
+    t = _THE_PREFIX_RE.sub('', t)
+    t = _THE_SUFFIX_RE.sub('', t)
+    
+    # 8. Remove ALL known tags (extended list) in a single pass
+    t = strip_tags(t)
     
     # 9. Remove version patterns (v1, v2, etc.)
-    t = re.sub(r'\bv\d+\b', '', t, flags=re.IGNORECASE)
+    t = _VERSION_RE.sub('', t)
     
     # 10. Remove trailing short words (likely release groups)
-    t = re.sub(r'\s+[a-z]{1,5}$', '', t)
+    t = _TRAILING_SHORT_RE.sub('', t)
     
     # 11. Normalize Roman numerals for sequels
-    for roman, digit in ROMAN_NUMERALS.items():
-        t = re.sub(rf'\b{roman}\b', digit, t)
+    t = _ROMAN_RE.sub(lambda m: ROMAN_NUMERALS[m.group(1)], t)
     
-    # 12. Keep only alphanumeric and spaces
-    t = re.sub(r'[^a-z0-9 ]', '', t)
+    # 12. Keep only alphanumeric and spaces (C-level lookup table, no regex)
+    t = t.encode('ascii', 'ignore').decode('ascii').translate(_DROP_NON_ALNUM_TABLE)
     
     # 13. Collapse whitespace and strip
-    t = re.sub(r'\s+', ' ', t).strip()
+    t = ' '.join(t.split())
     
     return t
 
@@ -236,9 +305,113 @@ def normalize_title(title: str, year: str = "") -> str:
 
 def compute_data_hash(name: str, size: str, source: str) -> str:
     """Compute fallback hash from metadata when magnet hash unavailable."""
-    norm_name = re.sub(r'[^a-z0-9]', '', name.lower())
+    norm_name = _NON_ALNUM_RE.sub('', name.lower())
     data = f"{norm_name}:{size}:{source}"
-    return hashlib.md5(data.encode()).hexdigest()[:16]
+    # In-process dedup key only (never persisted), so any fast 64-bit digest will do
+    return hashlib.blake2b(data.encode(), digest_size=8).hexdigest()
+
+
+# ═══════════════════════════════════════════════════════════════
+# LINE PARSING
+# ═══════════════════════════════════════════════════════════════
+
+def parse_line(line: str, seen_hashes: Optional[Set[str]] = None) -> Optional[tuple]:
+    """
+    Parse one input line into
+    (info_hash, title, line, source, name, magnet, quality, size, seeds, poster, year, imdb_id),
+    or None if it is malformed or its hash is already in seen_hashes (which
+    skips the metadata work for duplicates). Rows with an empty title are
+    still returned so their hash takes part in deduplication.
+    """
+    parts = line.split('|')
+    if len(parts) < 6:
+        return None
+    
+    source = parts[0]
+    name = parts[1]
+    magnet = parts[2]
+    quality_raw = parts[3]
+    size = parts[4]
+    seeds_text = parts[5] if len(parts) > 5 else "0"
+    poster = parts[6] if len(parts) > 6 else "N/A"
+    
+    # Extract hash for deduplication
+    info_hash = extract_info_hash(magnet)
+    if not info_hash:
+        # Fallback: compute data hash
+        info_hash = "data_" + compute_data_hash(name, size, source)
+    if seen_hashes is not None and info_hash in seen_hashes:
+        return None
+    
+    # Extract metadata
+    year = extract_year(name)
+    title = normalize_title(name, year)
+    quality = extract_quality(name)  # Re-extract for consistency
+    if quality == 'Unknown' and quality_raw:
+        quality = quality_raw.split()[0]
+    imdb_id = extract_imdb_id(line)
+    
+    return (info_hash, title, line, source, name, magnet, quality, size,
+            extract_seeds(seeds_text), poster, year, imdb_id)
+
+
+def _parse_shard(lines: List[str]) -> List[Optional[tuple]]:
+    """Worker entry point: parse a contiguous slice of the input."""
+    return [parse_line(line) for line in lines]
+
+
+def parse_lines_parallel(lines: List[str]) -> List[Optional[tuple]]:
+    """
+    Parse lines across CPU cores. Shards are contiguous and results are
+    concatenated in order, so first-seen dedup in main is unchanged.
+    """
+    from concurrent.futures import ProcessPoolExecutor  # ~20ms import; only paid for big inputs
+    
+    workers = os.cpu_count() or 1
+    size = -(-len(lines) // workers)
+    shards = [lines[i:i + size] for i in range(0, len(lines), size)]
+    try:
+        with ProcessPoolExecutor(max_workers=len(shards)) as ex:
+            return [rec for shard in ex.map(_parse_shard, shards) for rec in shard]
+    except Exception:
+        # No usable process pool (restricted environment): parse in-process
+        return _parse_shard(lines)
+
+
+# ═══════════════════════════════════════════════════════════════
+# RESULT STORAGE
+# ═══════════════════════════════════════════════════════════════
+
+@dataclass
+class ResultTable:
+    """Parsed results stored column-wise (struct of arrays); a row is a list index"""
+    originals: List[str] = field(default_factory=list)
+    sources: List[str] = field(default_factory=list)
+    names: List[str] = field(default_factory=list)
+    magnets: List[str] = field(default_factory=list)
+    qualities: List[str] = field(default_factory=list)
+    tiers: List[int] = field(default_factory=list)  # quality sort keys, precomputed
+    sizes: List[str] = field(default_factory=list)
+    seeds: List[int] = field(default_factory=list)
+    posters: List[str] = field(default_factory=list)
+    years: List[str] = field(default_factory=list)
+    imdb_ids: List[str] = field(default_factory=list)
+    
+    def append(self, original: str, source: str, name: str, magnet: str, quality: str,
+               size: str, seeds: int, poster: str, year: str, imdb_id: str) -> int:
+        """Add a row and return its index."""
+        self.originals.append(original)
+        self.sources.append(source)
+        self.names.append(name)
+        self.magnets.append(magnet)
+        self.qualities.append(quality)
+        self.tiers.append(QUALITY_ORDER.get(quality, 99))
+        self.sizes.append(size)
+        self.seeds.append(seeds)
+        self.posters.append(poster)
+        self.years.append(year)
+        self.imdb_ids.append(imdb_id)
+        return len(self.originals) - 1
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -288,55 +461,50 @@ def calculate_relevance_score(title: str, query: str) -> int:
     return 0
 
 
-def print_combined(items: List[Dict], preferred_year: str = ""):
-    """Print combined result for a group of items."""
-    if not items:
-        return
+def print_combined(table: ResultTable, rows: List[int], preferred_year: str = "") -> Optional[str]:
+    """Build the output line for a group of rows (the caller writes it)."""
+    if not rows:
+        return None
     
-    if len(items) == 1:
-        print(items[0]['original'])
-        return
+    if len(rows) == 1:
+        return table.originals[rows[0]]
+    
+    names = table.names
     
     # Pick best display name (prefer one with year)
-    best_name = items[0]['name']
+    best_name = names[rows[0]]
     if preferred_year:
-        for item in items:
-            if preferred_year in item['name']:
-                best_name = item['name']
+        for r in rows:
+            if preferred_year in names[r]:
+                best_name = names[r]
                 break
     else:
-        for item in items:
-            if re.search(r'\d{4}', item['name']):
-                best_name = item['name']
+        for r in rows:
+            if _ANY_YEAR_RE.search(names[r]):
+                best_name = names[r]
                 break
     
-    # Collect and dedupe data
-    sources = list(dict.fromkeys(i['source'] for i in items))  # Preserve order, dedupe
-    
-    # Sort qualities by tier
-    quality_items = [(i['quality'], i) for i in items]
-    quality_items.sort(key=lambda x: get_quality_sort_key(x[0]))
-    qualities = list(dict.fromkeys(q for q, _ in quality_items))
-    
-    # Calculate aggregates
-    seeds = [str(i['seeds']) for i in items]
-    total_seeds = sum(i['seeds'] for i in items)
-    sizes = list(dict.fromkeys(i['size'] for i in items))  # Dedupe sizes
-    magnets = [i['magnet'] for i in items]
-    
-    # Get best poster
+    # Collect, dedupe and aggregate in one pass over the rows
+    sources: Dict[str, None] = {}
+    qualities: Dict[str, int] = {}  # quality -> tier
+    sizes: Dict[str, None] = {}
+    seeds: List[str] = []
+    magnets: List[str] = []
     best_poster = "N/A"
-    for item in items:
-        if item.get('poster') and item['poster'] != "N/A":
-            best_poster = item['poster']
-            break
-    
-    # Get IMDB ID if available
     imdb_id = ""
-    for item in items:
-        if item.get('imdb_id'):
-            imdb_id = item['imdb_id']
-            break
+    for r in rows:
+        sources[table.sources[r]] = None
+        qualities[table.qualities[r]] = table.tiers[r]
+        sizes[table.sizes[r]] = None
+        seeds.append(str(table.seeds[r]))
+        magnets.append(table.magnets[r])
+        if best_poster == "N/A" and table.posters[r]:
+            best_poster = table.posters[r]
+        if not imdb_id:
+            imdb_id = table.imdb_ids[r]
+    
+    # Sort the (few) distinct qualities by tier; sort is stable, so ties keep first-seen order
+    qualities = sorted(qualities, key=qualities.__getitem__)
     
     # Format output: COMBINED|Name|Sources|Qualities|Seeds|Sizes|Magnets|Poster|IMDB|Count
     combined_line = (
@@ -348,9 +516,9 @@ def print_combined(items: List[Dict], preferred_year: str = ""):
         f"{'^'.join(magnets)}|"
         f"{best_poster}|"
         f"{imdb_id}|"
-        f"{len(items)}"
+        f"{len(rows)}"
     )
-    print(combined_line)
+    return combined_line
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -367,113 +535,123 @@ def main():
     if len(sys.argv) > 1:
         search_query = sys.argv[1]
     
-    # Read input
+    # Read input in one shot and split, instead of iterating the text wrapper
     try:
-        for line in sys.stdin:
-            line = line.strip()
-            if not line or '|' not in line:
-                continue
-            results.append(line)
+        data = sys.stdin.buffer.read().decode('utf-8', errors='replace')
     except Exception:
-        pass
+        data = ""
+    for line in data.split('\n'):
+        line = line.strip()
+        if not line or '|' not in line:
+            continue
+        results.append(line)
+    
+    # Batch dedup of identical lines (same line => same hash, so the per-row
+    # pass below would skip them anyway); dict.fromkeys keeps first-seen order
+    results = list(dict.fromkeys(results))
     
     # First pass: Parse and deduplicate by hash
-    title_groups: Dict[str, List[Dict]] = defaultdict(list)
+    table = ResultTable()
+    # Groups are numbered in first-seen order; rows and seed totals are
+    # kept in flat lists indexed by group id
+    group_ids: Dict[Tuple[str, str], int] = {}
+    group_rows: List[List[int]] = []
+    group_seeds: List[int] = []
+    
+    if len(results) > PARALLEL_MIN_LINES and (os.cpu_count() or 1) > 1:
+        parsed = parse_lines_parallel(results)
+    else:
+        # Lazy, so duplicates of already-added hashes are skipped before normalizing
+        parsed = (parse_line(line, seen_hashes) for line in results)
     
-    for line in results:
-        parts = line.split('|')
-        if len(parts) < 6:
+    for rec in parsed:
+        if rec is None:
             continue
-        
-        source = parts[0]
-        name = parts[1]
-        magnet = parts[2]
-        quality_raw = parts[3]
-        size = parts[4]
-        seeds_text = parts[5] if len(parts) > 5 else "0"
-        poster = parts[6] if len(parts) > 6 else "N/A"
-        
-        # Extract hash for deduplication
-        info_hash = extract_info_hash(magnet)
-        if not info_hash:
-            # Fallback: compute data hash
-            info_hash = "data_" + compute_data_hash(name, size, source)
+        info_hash, title, line, source, name, magnet, quality, size, seeds, poster, year, imdb_id = rec
         
         # Skip duplicates
         if info_hash in seen_hashes:
             continue
         seen_hashes.add(info_hash)
         
-        # Extract metadata
-        year = extract_year(name)
-        title = normalize_title(name, year)
-        quality = extract_quality(name)  # Re-extract for consistency
-        imdb_id = extract_imdb_id(line)
-        
         if not title:
             continue
         
-        item = {
-            'original': line,
-            'source': source,
-            'name': name,
-            'magnet': magnet,
-            'quality': quality if quality != 'Unknown' else quality_raw.split()[0] if quality_raw else 'Unknown',
-            'size': size,
-            'seeds': extract_seeds(seeds_text),
-            'poster': poster,
-            'year': year,
-            'imdb_id': imdb_id,
-            'hash': info_hash
-        }
+        row = table.append(
+            original=line,
+            source=source,
+            name=name,
+            magnet=magnet,
+            quality=quality,
+            size=size,
+            seeds=seeds,
+            poster=poster,
+            year=year,
+            imdb_id=imdb_id,
+        )
         
-        # Group key includes year to separate remakes
-        group_key = f"{title}_{year}" if year else title
-        title_groups[group_key].append(item)
+        # Group key includes year to separate remakes (year may be "")
+        group_key = (title, year)
+        gid = group_ids.get(group_key)
+        if gid is None:
+            gid = group_ids[group_key] = len(group_rows)
+            group_rows.append([])
+            group_seeds.append(0)
+        group_rows[gid].append(row)
+        group_seeds[gid] += seeds
     
     # Second pass: Handle year ambiguity within groups and collect for sorting
-    grouped_output: List[tuple] = []  # (relevance_score, total_seeds, items, preferred_year)
+    grouped_output: List[tuple] = []  # (relevance_score, total_seeds, rows, preferred_year)
+    years = table.years
+    seeds = table.seeds
     
-    for group_key, items in title_groups.items():
+    for gid, rows in enumerate(group_rows):
         # Collect all non-empty years
-        known_years = set(i['year'] for i in items if i['year'])
+        known_years = set(years[r] for r in rows if years[r])
         
         if len(known_years) <= 1:
             # No year conflict - all belong to same movie
             preferred_year = list(known_years)[0] if known_years else ""
             
             # Calculate relevance score for this group
-            # Use the normalized title from the first item for scoring
-            group_title = items[0]['name'] if items else ""
+            # Use the name of the first row for scoring
+            group_title = table.names[rows[0]] if rows else ""
             relevance = calculate_relevance_score(group_title, search_query)
             
-            # Calculate total seeds for secondary sorting
-            total_seeds = sum(i['seeds'] for i in items)
+            # Total seeds for secondary sorting (accumulated in the first pass)
+            total_seeds = group_seeds[gid]
             
-            grouped_output.append((relevance, total_seeds, items, preferred_year))
+            grouped_output.append((relevance, total_seeds, rows, preferred_year))
         else:
             # Multiple years found - split into separate movies
-            by_year: Dict[str, List[Dict]] = defaultdict(list)
-            for item in items:
-                y = item['year'] if item['year'] else "unknown"
-                by_year[y].append(item)
+            by_year: Dict[str, List[int]] = defaultdict(list)
+            for r in rows:
+                y = years[r] if years[r] else "unknown"
+                by_year[y].append(r)
             
-            for year_val, sub_items in by_year.items():
+            for year_val, sub_rows in by_year.items():
                 pref_year = year_val if year_val != "unknown" else ""
                 
                 # Calculate relevance and seeds for this sub-group
-                group_title = sub_items[0]['name'] if sub_items else ""
+                group_title = table.names[sub_rows[0]] if sub_rows else ""
                 relevance = calculate_relevance_score(group_title, search_query)
-                total_seeds = sum(i['seeds'] for i in sub_items)
+                total_seeds = sum(seeds[r] for r in sub_rows)
                 
-                grouped_output.append((relevance, total_seeds, sub_items, pref_year))
+                grouped_output.append((relevance, total_seeds, sub_rows, pref_year))
     
     # Sort by relevance (descending), then by seeds (descending)
     grouped_output.sort(key=lambda x: (-x[0], -x[1]))
     
-    # Print sorted results
-    for _, _, items, preferred_year in grouped_output:
-        print_combined(items, preferred_year=preferred_year)
+    # Output sorted results with a single write
+    out_lines = [
+        print_combined(table, rows, preferred_year=preferred_year)
+        for _, _, rows, preferred_year in grouped_output
+    ]
+    out_lines = [line for line in out_lines if line is not None]
+    if out_lines:
+        sys.stdout.write('\n'.join(out_lines))
+        sys.stdout.write('\n')
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -19,12 +19,16 @@ Usage:
 import sys
 import os
 import hashlib
+import sqlite3
+import threading
 import subprocess
 import urllib.request
+import urllib.error
 import shutil
 from pathlib import Path
 from typing import Optional, Tuple, List
 import time
+from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # ═══════════════════════════════════════════════════════════════
@@ -34,8 +38,131 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 CACHE_BASE = Path.home() / ".config" / "termflix" / "cache"
 VIU_CACHE_DIR = CACHE_BASE / "viu_renders"
 POSTER_CACHE_DIR = Path.home() / ".cache" / "termflix" / "posters"
-POSTER_URL_CACHE = Path.home() / ".cache" / "termflix" / "poster_urls"
+POSTER_URL_CACHE = Path.home() / ".cache" / "termflix" / "poster_urls"  # Legacy one-file-per-title cache
+POSTER_URL_DB = Path.home() / ".cache" / "termflix" / "poster_urls.sqlite"
 CACHE_TTL_DAYS = 7
+PRERENDER_WORKERS = min(8, os.cpu_count() or 4)  # Concurrent viu processes
+ENRICH_WORKERS = 10  # Concurrent poster URL lookups (network-bound)
+
+# In-process memo of resolved poster URLs, keyed by lowercased title
+# (None = lookup already failed this run)
+_poster_url_memo = {}
+
+
+def _validators_get(path: Path) -> Tuple[Optional[str], Optional[str]]:
+    """Stored (ETag, Last-Modified) for a downloaded poster"""
+    try:
+        with _url_db_lock:
+            row = _poster_url_db().execute(
+                'SELECT etag, last_modified FROM poster_validators WHERE path = ?', (str(path),)
+            ).fetchone()
+    except sqlite3.Error:
+        return None, None
+    return row if row else (None, None)
+
+
+def _validators_put(path: Path, etag: Optional[str], last_modified: Optional[str]) -> None:
+    """Remember a poster's validators (nothing is stored if the server sent none)"""
+    try:
+        with _url_db_lock:
+            db = _poster_url_db()
+            if etag or last_modified:
+                db.execute(
+                    'INSERT OR REPLACE INTO poster_validators (path, etag, last_modified) VALUES (?, ?, ?)',
+                    (str(path), etag, last_modified)
+                )
+            else:
+                db.execute('DELETE FROM poster_validators WHERE path = ?', (str(path),))
+            db.commit()
+    except sqlite3.Error:
+        pass  # Cache is best-effort
+
+
+@lru_cache(maxsize=None)
+def _which(program: str) -> bool:
+    """Whether program is on PATH (searched once per process)"""
+    return shutil.which(program) is not None
+
+
+def _stat(path: Path) -> Optional[os.stat_result]:
+    """One stat() call instead of exists() + stat(); None if the file is missing"""
+    try:
+        return path.stat()
+    except OSError:
+        return None
+
+
+def _nonempty(path: Path) -> bool:
+    """True if path exists and has content"""
+    st = _stat(path)
+    return st is not None and st.st_size > 0
+
+
+# Resolved poster URLs, keyed by lowercased title; shared by the enrich workers
+_url_db_lock = threading.Lock()
+_url_db = None
+
+
+def _poster_url_db() -> sqlite3.Connection:
+    """Open (once) the poster URL cache"""
+    global _url_db
+    if _url_db is None:
+        POSTER_URL_DB.parent.mkdir(parents=True, exist_ok=True)
+        _url_db = sqlite3.connect(str(POSTER_URL_DB), timeout=5, check_same_thread=False)
+        _url_db.execute('PRAGMA journal_mode=WAL')
+        _url_db.execute(
+            'CREATE TABLE IF NOT EXISTS poster_urls ('
+            'title TEXT PRIMARY KEY, url TEXT NOT NULL, fetched_at REAL NOT NULL)'
+        )
+        # HTTP validators of downloaded posters, for conditional revalidation
+        _url_db.execute(
+            'CREATE TABLE IF NOT EXISTS poster_validators ('
+            'path TEXT PRIMARY KEY, etag TEXT, last_modified TEXT)'
+        )
+        _url_db.commit()
+    return _url_db
+
+
+def _url_cache_get(title_lower: str) -> Optional[str]:
+    """Cached poster URL for a title, or None"""
+    try:
+        with _url_db_lock:
+            row = _poster_url_db().execute(
+                'SELECT url FROM poster_urls WHERE title = ?', (title_lower,)
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+
+def _url_cache_put(title_lower: str, url: str) -> None:
+    """Store a resolved poster URL (failures are never stored)"""
+    try:
+        with _url_db_lock:
+            db = _poster_url_db()
+            db.execute(
+                'INSERT OR REPLACE INTO poster_urls (title, url, fetched_at) VALUES (?, ?, ?)',
+                (title_lower, url, time.time())
+            )
+            db.commit()
+    except sqlite3.Error:
+        pass  # Cache is best-effort
+
+
+_api_lock = threading.Lock()
+_api_instance = None
+
+
+def _termflix_api():
+    """Shared TermflixAPI instance, imported and built once per process (thread-safe)"""
+    global _api_instance
+    if _api_instance is None:
+        with _api_lock:
+            if _api_instance is None:
+                sys.path.insert(0, str(Path(__file__).parent))
+                from api import TermflixAPI
+                _api_instance = TermflixAPI()
+    return _api_instance
 
 
 class PosterCache:
@@ -45,16 +172,19 @@ class PosterCache:
         # Ensure directories exist
         VIU_CACHE_DIR.mkdir(parents=True, exist_ok=True)
         POSTER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        POSTER_URL_CACHE.mkdir(parents=True, exist_ok=True)
     
     @staticmethod
     def hash(text: str) -> str:
-        """Generate MD5 hash from text"""
+        """
+        Generate MD5 hash from text.
+        Kept as MD5: the shell modules name poster and URL cache files with md5/md5sum
+        of the same strings, so a different hash would split the shared cache.
+        """
         return hashlib.md5(text.encode()).hexdigest()
     
     @staticmethod
     def viu_cache_key(image_source: str, width: int = 15, height: int = 10) -> str:
-        """Generate cache key for VIU rendered image"""
+        """Generate cache key for VIU rendered image (same scheme as viu_cache_key in modules/posters.sh)"""
         key_input = f"{image_source}_{width}x{height}"
         full_hash = hashlib.md5(key_input.encode()).hexdigest()
         return full_hash[:16]
@@ -62,26 +192,27 @@ class PosterCache:
     @staticmethod
     def viu_available() -> bool:
         """Check if viu is installed"""
-        return shutil.which('viu') is not None
+        return _which('viu')
     
     @staticmethod
     def chafa_available() -> bool:
         """Check if chafa is installed"""
-        return shutil.which('chafa') is not None
+        return _which('chafa')
     
     @staticmethod
     def kitty_available() -> bool:
         """Check if running in Kitty terminal with icat"""
         if os.environ.get('TERM') != 'xterm-kitty':
             return False
-        return shutil.which('kitty') is not None
+        return _which('kitty')
     
     def viu_cache_exists(self, cache_key: str) -> bool:
         """Check if cached VIU render exists and is valid"""
         cache_file = VIU_CACHE_DIR / f"{cache_key}.ansi"
-        if cache_file.exists() and cache_file.stat().st_size > 0:
+        st = _stat(cache_file)
+        if st is not None and st.st_size > 0:
             # Check age
-            file_age_days = (time.time() - cache_file.stat().st_mtime) / 86400
+            file_age_days = (time.time() - st.st_mtime) / 86400
             return file_age_days < CACHE_TTL_DAYS
         return False
     
@@ -96,7 +227,7 @@ class PosterCache:
         Returns path to cached ANSI file or None on failure.
         """
         image_file = Path(image_path)
-        if not image_file.exists() or image_file.stat().st_size == 0:
+        if not _nonempty(image_file):
             return None
         
         # Generate cache key if not provided
@@ -106,7 +237,7 @@ class PosterCache:
         cache_file = VIU_CACHE_DIR / f"{cache_key}.ansi"
         
         # Return cached if exists
-        if cache_file.exists() and cache_file.stat().st_size > 0:
+        if _nonempty(cache_file):
             return cache_file
         
         # Check viu availability
@@ -152,23 +283,52 @@ class PosterCache:
                 ext = '.webp'
             dest = POSTER_CACHE_DIR / f"{url_hash}{ext}"
         
-        # Return if already cached
-        if dest.exists() and dest.stat().st_size > 0:
-            return dest
+        # Return if already cached; once past the TTL, revalidate with the
+        # server instead of waiting for cleanup to delete it and refetching
+        headers = {'User-Agent': 'Mozilla/5.0'}
+        st = _stat(dest)
+        if st is not None and st.st_size > 0:
+            if time.time() - st.st_mtime < CACHE_TTL_DAYS * 86400:
+                return dest
+            etag, last_modified = _validators_get(dest)
+            if not (etag or last_modified):
+                return dest
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
         
-        # Download
+        # Download: stream into a .part file, then rename into place so readers
+        # (including the shell previews) never see a half-written poster.
+        # One .part per writer: concurrent downloads of a poster must not share it
+        tmp = dest.with_name(f"{dest.name}.{os.getpid()}.{threading.get_ident()}.part")
         try:
-            req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-            with urllib.request.urlopen(req, timeout=10) as response:
-                dest.write_bytes(response.read())
+            req = urllib.request.Request(url, headers=headers)
+            with urllib.request.urlopen(req, timeout=10) as response, open(tmp, 'wb') as f:
+                shutil.copyfileobj(response, f, 1 << 16)
+                validators = (response.headers.get('ETag'), response.headers.get('Last-Modified'))
             
-            if dest.exists() and dest.stat().st_size > 0:
+            if tmp.stat().st_size > 0:
+                os.replace(tmp, dest)
+                _validators_put(dest, *validators)
                 return dest
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                # Unchanged on the server: keep the file and restart its TTL
+                try:
+                    os.utime(dest)
+                    return dest
+                except OSError:
+                    # Swept by cleanup_old_cache meanwhile: fetch it again
+                    # (unconditionally now, so this can't recurse twice)
+                    tmp.unlink(missing_ok=True)
+                    return self.download_poster(url, output_path) if st is not None else None
         except Exception:
             pass
         
-        dest.unlink(missing_ok=True)
-        return None
+        tmp.unlink(missing_ok=True)
+        # A stale copy beats nothing if revalidation failed
+        return dest if st is not None and st.st_size > 0 else None
     
     def get_or_download_poster(self, url: str, width: int = 20, height: int = 15) -> Tuple[Optional[Path], Optional[Path]]:
         """
@@ -187,11 +347,30 @@ class PosterCache:
     
     def display_cached_viu(self, cache_path: Path) -> bool:
         """Display cached VIU ANSI to stdout"""
-        if cache_path.exists() and cache_path.stat().st_size > 0:
-            sys.stdout.buffer.write(cache_path.read_bytes())
+        try:
+            src = open(cache_path, 'rb')
+        except OSError:
+            return False
+        with src:
+            size = os.fstat(src.fileno()).st_size
+            if size == 0:
+                return False
             sys.stdout.flush()
-            return True
-        return False
+            offset = 0
+            try:
+                # Kernel-side copy (Linux); macOS only sends to sockets
+                out_fd = sys.stdout.fileno()
+                while offset < size:
+                    sent = os.sendfile(out_fd, src.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except (OSError, AttributeError, ValueError):
+                # Unsupported stdout (or interrupted): copy the rest in userspace
+                src.seek(offset)
+                shutil.copyfileobj(src, sys.stdout.buffer)
+            sys.stdout.flush()
+        return True
     
     def cleanup_old_cache(self) -> int:
         """
@@ -201,54 +380,74 @@ class PosterCache:
         deleted = 0
         cutoff = time.time() - (CACHE_TTL_DAYS * 86400)
         
-        # Clean VIU cache
-        for f in VIU_CACHE_DIR.glob("*.ansi"):
-            if f.stat().st_mtime < cutoff:
-                f.unlink(missing_ok=True)
-                deleted += 1
-        
-        # Clean poster cache
-        for f in POSTER_CACHE_DIR.glob("*"):
-            if f.is_file() and f.stat().st_mtime < cutoff:
-                f.unlink(missing_ok=True)
-                deleted += 1
+        # One scandir sweep per directory: the file type comes from the directory
+        # listing itself, leaving a single lstat per file for the mtime
+        for directory, suffix in ((VIU_CACHE_DIR, ".ansi"), (POSTER_CACHE_DIR, "")):
+            try:
+                it = os.scandir(directory)
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    if not entry.name.endswith(suffix) or entry.name.startswith('.'):
+                        continue
+                    try:
+                        if (entry.is_file(follow_symlinks=False)
+                                and entry.stat(follow_symlinks=False).st_mtime < cutoff):
+                            os.unlink(entry.path)
+                            deleted += 1
+                    except OSError:
+                        pass
         
         return deleted
     
     def prerender_batch(self, image_paths: list, width: int = 15, height: int = 10) -> list:
         """Pre-render multiple posters (for background caching)"""
-        results = []
-        for path in image_paths:
-            result = self.prerender_viu(path, width, height)
-            if result:
-                results.append(result)
-        return results
+        if len(image_paths) <= 1:
+            results = [self.prerender_viu(path, width, height) for path in image_paths]
+        else:
+            # Each render is a separate viu process, so threads overlap them fully
+            workers = min(PRERENDER_WORKERS, len(image_paths))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(lambda path: self.prerender_viu(path, width, height), image_paths))
+        return [result for result in results if result]
     
     def fetch_poster_url(self, title: str) -> Optional[str]:
         """
         Fetch poster URL for a movie title using api.py.
         Uses cached URLs when available.
         """
-        title_hash = self.hash(title.lower())
-        cache_file = POSTER_URL_CACHE / f"{title_hash}.txt"
+        title_lower = title.lower()
+        if title_lower in _poster_url_memo:
+            return _poster_url_memo[title_lower]
         
+        url = self._resolve_poster_url(title, title_lower)
+        _poster_url_memo[title_lower] = url
+        return url
+    
+    def _resolve_poster_url(self, title: str, title_lower: str) -> Optional[str]:
+        """Disk cache, then api.py lookup (uncached by fetch_poster_url's memo)"""
         # Check URL cache
-        if cache_file.exists():
-            url = cache_file.read_text().strip()
-            if url and url not in ('N/A', 'null', ''):
-                return url
+        url = _url_cache_get(title_lower)
+        if url:
+            return url
         
-        # Try to import and use api module
+        # Entries written before the SQLite cache: migrate on first use
+        legacy_file = POSTER_URL_CACHE / f"{self.hash(title_lower)}.txt"
         try:
-            script_dir = Path(__file__).parent
-            sys.path.insert(0, str(script_dir))
-            from api import TermflixAPI
-            
-            api = TermflixAPI()
-            url = api.get_poster_url(title)
+            url = legacy_file.read_text().strip()
+        except OSError:
+            url = ''
+        if url and url not in ('N/A', 'null'):
+            _url_cache_put(title_lower, url)
+            return url
+        
+        # Try to use the shared api module instance
+        try:
+            url = _termflix_api().get_poster_url(title)
             
             if url and url not in ('N/A', 'null', ''):
-                cache_file.write_text(url)
+                _url_cache_put(title_lower, url)
                 return url
         except Exception:
             pass
@@ -260,50 +459,65 @@ class PosterCache:
         Enrich catalog entries with missing posters.
         
         Args:
-            items: List of pipe-delimited catalog entries
+            items: List of pipe-delimited catalog entries (updated in place)
             max_enrich: Maximum number of items to enrich (per call)
         
         Returns:
-            Updated list of catalog entries with posters filled in
+            The same list, with posters filled in
         """
-        enriched_items = items.copy()
+        enriched_items = items
         enriched_count = 0
         
-        # Find items needing enrichment
+        # Find items needing enrichment: locate the poster field (index 6) with
+        # str.find and only slice out the title for lines that need a poster
         to_enrich = []
         for i, item in enumerate(items):
             if enriched_count >= max_enrich:
                 break
             
-            parts = item.split('|')
-            if len(parts) < 7:
-                continue
+            pos = -1
+            for _ in range(6):
+                pos = item.find('|', pos + 1)
+                if pos < 0:
+                    break
+            if pos < 0:
+                continue  # Fewer than 7 fields
             
-            poster_url = parts[6] if len(parts) > 6 else ''
-            if poster_url in ('N/A', '', 'null'):
-                name = parts[1]  # Get title from second field
-                to_enrich.append((i, name, parts))
+            poster_start = pos + 1
+            poster_end = item.find('|', poster_start)
+            if poster_end < 0:
+                poster_end = len(item)
+            if item[poster_start:poster_end] in ('N/A', '', 'null'):
+                title_start = item.find('|') + 1
+                name = item[title_start:item.find('|', title_start)]  # Title is the second field
+                to_enrich.append((i, name, (poster_start, poster_end)))
                 enriched_count += 1
         
         if not to_enrich:
             return enriched_items
         
+        # One lookup per distinct title; duplicates share its result
+        by_title = {}
+        for idx, name, bounds in to_enrich:
+            by_title.setdefault(name.lower(), (name, []))[1].append((idx, bounds))
+        
         # Fetch posters in parallel
-        with ThreadPoolExecutor(max_workers=5) as executor:
+        workers = min(ENRICH_WORKERS, len(by_title))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
             futures = {
-                executor.submit(self.fetch_poster_url, name): (idx, name, parts)
-                for idx, name, parts in to_enrich
+                executor.submit(self.fetch_poster_url, name): rows
+                for name, rows in by_title.values()
             }
             
             for future in as_completed(futures):
-                idx, name, parts = futures[future]
                 try:
                     new_url = future.result()
-                    if new_url and new_url not in ('N/A', 'null', ''):
-                        parts[6] = new_url
-                        enriched_items[idx] = '|'.join(parts)
                 except Exception:
-                    pass
+                    continue
+                if new_url and new_url not in ('N/A', 'null', ''):
+                    for idx, (start, end) in futures[future]:
+                        item = enriched_items[idx]
+                        enriched_items[idx] = item[:start] + new_url + item[end:]
         
         return enriched_items
 
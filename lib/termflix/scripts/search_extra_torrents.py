@@ -5,12 +5,16 @@ Reads "Title|Year" from stdin, searches TPB for all versions, and outputs raw to
 Used to find better qualities/sources for movies already identified in the catalog.
 """
 import sys
-import urllib.request
+import http.client
+import threading
 import urllib.parse
+import urllib.request
+import base64
 import json
 import zlib
 import re
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
 # API Endpoints
 TPB_API = "https://apibay.org/q.php"
@@ -34,62 +38,159 @@ def get_trackers_string():
 
 TRACKERS_STR = get_trackers_string()
 
-def search_tpb(title, year):
-    """Search TPB for 'Title Year' and return formatted lines."""
+# One keep-alive connection per host per worker thread: each worker handles
+# many queries against the same host, so only its first query pays for TCP+TLS
+_local = threading.local()
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+_MAX_REDIRECTS = 5
+
+# HTTP(S)_PROXY / NO_PROXY, read the same way urllib.request does
+_PROXIES = urllib.request.getproxies()
+
+@lru_cache(maxsize=16)
+def _proxy_for(scheme, host):
+    """Proxy to reach scheme://host through, or None to connect directly."""
+    proxy = _PROXIES.get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    if '://' not in proxy:
+        proxy = 'http://' + proxy
+    return urllib.parse.urlsplit(proxy)
+
+def _proxy_headers(proxy):
+    """Proxy-Authorization for a proxy URL with credentials, else nothing."""
+    if not proxy.username:
+        return {}
+    creds = f"{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or '')}"
+    return {'Proxy-Authorization': 'Basic ' + base64.b64encode(creds.encode()).decode('ascii')}
+
+def _get_connection(scheme, host, timeout):
+    """Return this thread's persistent connection to scheme://host."""
+    pool = getattr(_local, 'pool', None)
+    if pool is None:
+        pool = _local.pool = {}
+    conn = pool.get((scheme, host))
+    if conn is None:
+        proxy = _proxy_for(scheme, host)
+        if scheme == 'https':
+            if proxy:
+                # CONNECT tunnel through the proxy; TLS runs end to end inside it
+                conn = http.client.HTTPSConnection(proxy.hostname, proxy.port, timeout=timeout)
+                conn.set_tunnel(host, headers=_proxy_headers(proxy))
+            else:
+                conn = http.client.HTTPSConnection(host, timeout=timeout)
+        elif proxy:
+            # Plain HTTP proxies take absolute-form requests (see tpb_get)
+            conn = http.client.HTTPConnection(proxy.hostname, proxy.port, timeout=timeout)
+        else:
+            conn = http.client.HTTPConnection(host, timeout=timeout)
+        pool[(scheme, host)] = conn
+    return conn
+
+def _drop_connection(scheme, host):
+    """Close and forget this thread's connection to scheme://host."""
+    conn = getattr(_local, 'pool', {}).pop((scheme, host), None)
+    if conn is not None:
+        conn.close()
+
+def tpb_get(params, timeout=10):
+    """GET the TPB API on this thread's persistent connection, following redirects, and return the body."""
+    url = f"{TPB_API}?{params}"
+    for _ in range(_MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        scheme, host = parts.scheme, parts.netloc
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        headers = {'User-Agent': 'Mozilla/5.0'}
+        proxy = _proxy_for(scheme, host) if scheme == 'http' else None
+        if proxy:
+            path = f"http://{host}{path}"
+            headers.update(_proxy_headers(proxy))
+        for attempt in range(2):
+            conn = _get_connection(scheme, host, timeout)
+            reused = conn.sock is not None
+            try:
+                conn.request('GET', path, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # Server dropped an idle keep-alive connection: reconnect once
+                _drop_connection(scheme, host)
+                if reused and attempt == 0:
+                    continue
+                raise
+            except Exception:
+                _drop_connection(scheme, host)
+                raise
+        location = response.getheader('Location')
+        if response.status in _REDIRECT_CODES and location:
+            url = urllib.parse.urljoin(url, location)
+            continue
+        if response.status != 200:
+            raise http.client.HTTPException(f"HTTP {response.status}")
+        return body
+    raise http.client.HTTPException(f"Too many redirects for {TPB_API}")
+
+def detect_quality(name):
+    """
+    Classify a release name, highest tier first.
+    Plain substring checks in priority order: a single regex alternation would
+    return the leftmost token instead of the best one, and measured slower.
+    """
+    if "2160p" in name or "4K" in name: return "4K"
+    if "1080p" in name: return "1080p"
+    if "720p" in name: return "720p"
+    if "480p" in name: return "480p"
+    if "CAM" in name: return "CAM"  # Also covers HDCAM
+    if "HDRip" in name or "DVDRip" in name: return "Rip"
+    if "WEBRip" in name or "WEB-DL" in name: return "Web"
+    return "Unknown"
+
+def format_results(data, year):
+    """Format TPB API items as Source|Name|Magnet|Quality|Size|Seeds lines."""
+    # Per-item work in one loop with the helpers bound to locals
+    quote = urllib.parse.quote
+    detect = detect_quality
+    tail = "&" + TRACKERS_STR
+    results = []
+    append = results.append
+    for item in data:
+        name = item.get('name', 'Unknown')
+        # Basic validation: Must contain title words and year
+        # (Simple check to avoid completely unrelated results)
+        if year and year not in name:
+            continue
+        
+        size_bytes = int(item.get('size', 0))
+        if size_bytes > 1073741824:
+            size = f"{size_bytes/1073741824:.1f}GB"
+        else:
+            size = f"{size_bytes/1048576:.0f}MB"
+        
+        magnet = f"magnet:?xt=urn:btih:{item.get('info_hash')}&dn={quote(name)}{tail}"
+        append(f"TPB|{name}|{magnet}|{detect(name)}|{size}|{item.get('seeders', '0')}")
+    return results
+
+def build_query(title, year):
+    """Build the TPB query string for a title/year pair."""
     # Clean title: remove year parens if present to avoid "Movie (2022) 2022"
     if year:
         title = title.replace(f"({year})", "").strip()
-        
-    query = f"{title} {year}".strip()
+    return f"{title} {year}".strip()
+
+def search_tpb(title, year):
+    """Search TPB for 'Title Year' and return formatted lines."""
+    query = build_query(title, year)
     try:
         params = urllib.parse.urlencode({'q': query, 'cat': '200'}) # 200 = Video
-        url = f"{TPB_API}?{params}"
-        
-        req = urllib.request.Request(url)
-        req.add_header('User-Agent', 'Mozilla/5.0')
-        
-        with urllib.request.urlopen(req, timeout=10) as response:
-            data = json.loads(response.read())
+        data = json.loads(tpb_get(params))
             
         if not data or data[0].get('name') == 'No results returned':
             return []
             
-        results = []
-        for item in data:
-            name = item.get('name', 'Unknown')
-            # Basic validation: Must contain title words and year
-            # (Simple check to avoid completely unrelated results)
-            if year and year not in name:
-                continue
-                
-            info_hash = item.get('info_hash')
-            seeders = item.get('seeders', '0')
-            size_bytes = int(item.get('size', 0))
-            
-            # Convert size
-            if size_bytes > 1073741824:
-                size = f"{size_bytes/1073741824:.1f}GB"
-            else:
-                size = f"{size_bytes/1048576:.0f}MB"
-            
-            # Determine quality
-            quality = "Unknown"
-            if "2160p" in name or "4K" in name: quality = "4K"
-            elif "1080p" in name: quality = "1080p"
-            elif "720p" in name: quality = "720p"
-            elif "480p" in name: quality = "480p"
-            elif "CAM" in name or "HDCAM" in name: quality = "CAM"
-            elif "HDRip" in name or "DVDRip" in name: quality = "Rip"
-            elif "WEBRip" in name or "WEB-DL" in name: quality = "Web"
-            
-            # Construct magnet
-            magnet = f"magnet:?xt=urn:btih:{info_hash}&dn={urllib.parse.quote(name)}&{TRACKERS_STR}"
-            
-            # Format: Source|Name|Magnet|Quality|Size|Seeds
-            line = f"TPB|{name}|{magnet}|{quality}|{size}|{seeders}"
-            results.append(line)
-            
-        return results
+        return format_results(data, year)
         
     except Exception as e:
         # Silently fail on error
@@ -109,25 +210,29 @@ def worker(line):
 
 def main():
     """Read 'Title|Year' lines from stdin and search in parallel."""
-    tasks = []
-    # Read all input lines
+    tasks = {}
+    # Read all input lines; repeated titles (series, re-releases) collapse
+    # onto one TPB query, keyed case-insensitively, first occurrence wins
     for line in sys.stdin:
         line = line.strip()
-        if line:
-            tasks.append(line)
+        if not line:
+            continue
+        parts = line.split('|')
+        key = build_query(parts[0], parts[1]).lower() if len(parts) >= 2 else line
+        tasks.setdefault(key, line)
+    tasks = list(tasks.values())
 
-    results = []
-    # Parallel execution (50 workers)
+    # Parallel execution (50 workers); each query's torrents are written as
+    # soon as it completes so the consumer can start before the slowest query
+    write = sys.stdout.write
     with ThreadPoolExecutor(max_workers=50) as executor:
         futures = [executor.submit(worker, t) for t in tasks]
         for future in as_completed(futures):
             res = future.result()
             if res:
-                results.extend(res)
-                
-    # Output all found torrents
-    for line in results:
-        print(line)
+                write('\n'.join(res))
+                write('\n')
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     main()
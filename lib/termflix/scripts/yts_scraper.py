@@ -9,95 +9,109 @@ import sys
 import urllib.request
 import urllib.parse
 from typing import List, Dict, Optional
-from html.parser import HTMLParser
+from html import unescape
 
 
-class YTSMovieParser(HTMLParser):
-    """Parse YTS HTML to extract movie data"""
-    
-    def __init__(self):
-        super().__init__()
-        self.movies = []
-        self.current_movie = {}
-        self.in_movie_card = False
-        self.in_title = False
-        self.in_year = False
-        self.in_genres = False
-        self.in_rating = False
-        
-    def handle_starttag(self, tag, attrs):
-        attrs_dict = dict(attrs)
-        
-        # Detect movie card start
-        if tag == 'div' and attrs_dict.get('class') == 'movie-card':
-            self.in_movie_card = True
-            self.current_movie = {}
-            
-            # Extract from onclick: openModal(ID, "IMDB", "Title", "Year")
-            onclick = attrs_dict.get('onclick', '')
-            match = re.search(r'openModal\((\d+),\s*"([^"]*)",\s*"([^"]*)",\s*"([^"]*)"\)', onclick)
-            if match:
-                self.current_movie['id'] = match.group(1)
-                self.current_movie['imdb'] = match.group(2)
-                self.current_movie['title'] = match.group(3)
-                self.current_movie['year'] = match.group(4)
-        
-        # Extract poster
-        elif self.in_movie_card and tag == 'img' and 'movie-poster' in attrs_dict.get('class', ''):
-            self.current_movie['poster'] = attrs_dict.get('src', '')
-        
-        # Extract quality
-        elif self.in_movie_card and tag == 'span' and 'movie-quality' in attrs_dict.get('class', ''):
-            # Next data will be quality
-            pass
-        
-        # Extract rating
-        elif self.in_movie_card and tag == 'span' and 'movie-rating' in attrs_dict.get('class', ''):
-            self.in_rating = True
-        
-        # Title
-        elif self.in_movie_card and tag == 'h3' and 'movie-title' in attrs_dict.get('class', ''):
-            self.in_title = True
-        
-        # Year
-        elif self.in_movie_card and tag == 'span' and 'movie-year' in attrs_dict.get('class', ''):
-            self.in_year = True
-        
-        # Genres
-        elif self.in_movie_card and tag == 'span' and 'movie-genres' in attrs_dict.get('class', ''):
-            self.in_genres = True
+# Card markup patterns (compiled once at import)
+_CARD_START_RE = re.compile(r'<div\b([^>]*movie-card[^>]*)>', re.IGNORECASE)
+_CARD_END_RE = re.compile(r'</div\s*>', re.IGNORECASE)
+_ATTR_RE = re.compile(r'([^\s=/>]+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+)))?')
+# Inside a card: start tag (name, attrs) | other markup | text
+_TOKEN_RE = re.compile(r'<([a-zA-Z][^\s/>]*)([^>]*)>|<[^>]*>|([^<]+)')
+_OPENMODAL_RE = re.compile(r'openModal\((\d+),\s*"([^"]*)",\s*"([^"]*)",\s*"([^"]*)"\)')
+_QUALITY_TEXT_RE = re.compile(r'^\d+p$|^3D$|^4K$')
+
+
+def parse_attrs(attr_text: str) -> Dict[str, str]:
+    """Parse a start tag's attribute text into a dict (names lowercased, values unescaped)"""
+    attrs = {}
+    for m in _ATTR_RE.finditer(attr_text):
+        value = m.group(2) if m.group(2) is not None else m.group(3) if m.group(3) is not None else m.group(4) or ''
+        attrs[m.group(1).lower()] = unescape(value)
+    return attrs
+
+
+def parse_card(onclick: str, body: str) -> Optional[Dict]:
+    """Extract one movie from a card's onclick handler and inner HTML"""
+    # Extract from onclick: openModal(ID, "IMDB", "Title", "Year")
+    match = _OPENMODAL_RE.search(onclick)
+    if not match:
+        return None
+    movie = {
+        'id': match.group(1),
+        'imdb': match.group(2),
+        'title': match.group(3),
+        'year': match.group(4),
+    }
     
-    def handle_data(self, data):
-        data = data.strip()
-        if not data or not self.in_movie_card:
-            return
+    in_rating = in_year = in_genres = False
+    for tok in _TOKEN_RE.finditer(body):
+        tag, attr_text, data = tok.groups()
+        if tag:
+            tag = tag.lower()
+            if tag not in ('img', 'span'):
+                continue
+            attrs = parse_attrs(attr_text)
+            cls = attrs.get('class', '')
+            if tag == 'img':
+                if 'movie-poster' in cls:
+                    movie['poster'] = attrs.get('src', '')
+            elif 'movie-quality' in cls:
+                pass  # Quality text is picked up by pattern below
+            elif 'movie-rating' in cls:
+                in_rating = True
+            elif 'movie-year' in cls:
+                in_year = True
+            elif 'movie-genres' in cls:
+                in_genres = True
+            continue
+        
+        if data is None:
+            continue
+        data = unescape(data).strip()
+        if not data:
+            continue
         
         # Extract rating (remove star icon, get number)
-        if self.in_rating and data and data[0].isdigit():
-            self.current_movie['rating'] = data
-            self.in_rating = False
-        
-        # Year
-        elif self.in_year and data.isdigit():
-            self.current_movie['year'] = data
-            self.in_year = False
-        
-        # Genres
-        elif self.in_genres:
-            self.current_movie['genres'] = data
-            self.in_genres = False
-        
+        if in_rating and data[0].isdigit():
+            movie['rating'] = data
+            in_rating = False
+        elif in_year and data.isdigit():
+            movie['year'] = data
+            in_year = False
+        elif in_genres:
+            movie['genres'] = data
+            in_genres = False
         # Quality (look for patterns like 720p, 1080p)
-        elif re.match(r'^\d+p$|^3D$|^4K$', data):
-            self.current_movie['quality'] = data
+        elif _QUALITY_TEXT_RE.match(data):
+            movie['quality'] = data
     
-    def handle_endtag(self, tag):
-        if tag == 'div' and self.in_movie_card:
-            # Check if we have minimal data
-            if 'title' in self.current_movie and 'imdb' in self.current_movie:
-                self.movies.append(self.current_movie.copy())
-            self.in_movie_card = False
-            self.current_movie = {}
+    return movie
+
+
+def parse_movies(html: str) -> List[Dict]:
+    """
+    Extract movies from a YTS listing page.
+    A card runs from its <div class="movie-card"> to the first closing </div>.
+    """
+    movies = []
+    starts = []
+    for m in _CARD_START_RE.finditer(html):
+        attrs = parse_attrs(m.group(1))
+        if attrs.get('class') == 'movie-card':
+            starts.append((m, attrs.get('onclick', '')))
+    
+    for i, (start, onclick) in enumerate(starts):
+        end = _CARD_END_RE.search(html, start.end())
+        if not end:
+            break  # Unclosed card at end of page
+        # A card opened before this one closed replaces it
+        if i + 1 < len(starts) and starts[i + 1][0].start() < end.start():
+            continue
+        movie = parse_card(onclick, html[start.end():end.start()])
+        if movie:
+            movies.append(movie)
+    return movies
 
 
 def scrape_yts_page(page: int = 1, sort: str = 'date_added', search: str = '', 
@@ -138,10 +152,7 @@ def scrape_yts_page(page: int = 1, sort: str = 'date_added', search: str = '',
             html = response.read().decode('utf-8', errors='ignore')
         
         # Parse HTML
-        parser = YTSMovieParser()
-        parser.feed(html)
-        
-        return parser.movies
+        return parse_movies(html)
         
     except Exception as e:
         print(f"Error scraping YTS: {e}", file=sys.stderr)
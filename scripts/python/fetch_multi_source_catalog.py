@@ -6,15 +6,24 @@
 import sys
 import os
 import json
-import urllib.request
+import gzip
+import zlib
+import http.client
+import socket
+import threading
+import queue
 import urllib.parse
+import urllib.request
 import ssl
+import base64
 import time
 from datetime import datetime
 import hashlib
 import re
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from functools import lru_cache
+from operator import itemgetter
 from typing import Dict, List, Optional, Tuple
 
 # ═══════════════════════════════════════════════════════════════
@@ -30,10 +39,24 @@ TPB_SEARCH_URL = 'https://apibay.org/q.php'
 # Request settings
 TIMEOUT = 8
 MAX_RETRIES = 2
+# Concurrent per-movie searches: apibay starts rate limiting much past this.
+# TERMFLIX_FETCH_WORKERS overrides it.
+SEARCH_WORKERS = 15
 
 # Cache settings
 CACHE_DIR = Path.home() / '.cache' / 'termflix' / 'multi_source'
+# Plain-string prefix: cache lookups run per query, Path joins cost more than concat
+_CACHE_PREFIX = os.path.join(str(CACHE_DIR), '')
 CACHE_TTL = 14400  # 4 hours
+# Per-kind TTLs where the default is a poor fit. Latest-uploads feeds turn
+# over within the hour; title searches keep the default because their seed
+# counts drive the catalog sort.
+CACHE_TTLS = {
+    'yts_list': 3600,      # 1 hour: new uploads land on the first pages
+    'eztv_shows': 1800,    # 30 min: latest-episodes feed
+    'eztv_search': 86400,  # 1 day: an IMDB id's episode list only grows
+    'catalog': 300,        # 5 min: finished output, reused while paging
+}
 
 # Global flags
 REFRESH_CACHE = False
@@ -47,6 +70,69 @@ HEADERS = {
     'Connection': 'keep-alive',
 }
 
+# ═══════════════════════════════════════════════════════════════
+# TITLE PATTERNS (compiled once at import; the grouping helpers run per torrent)
+# ═══════════════════════════════════════════════════════════════
+
+_TV_RE = re.compile(r'(S\d{1,2}E\d{1,2}|Season\s*\d+|Complete\s*Series|\d+x\d+)', re.IGNORECASE)
+_YEAR_RE = re.compile(r'(19|20)\d{2}')
+_WS_RE = re.compile(r'\s+')
+_BRACKETS_RE = re.compile(r'\[.*?\]')
+_RELEASE_GROUP_RE = re.compile(r'-[A-Za-z0-9]+$')
+
+# normalize_series_name
+_SERIES_CUT_RE = re.compile(r'^(.+?)[\.\s]+(?:S\d{1,2}(?:E\d{1,4})?|\d+x\d+|Season\s*\d+)', re.IGNORECASE)
+_SERIES_QUALITY_RE = re.compile(r'[\.\s]+(1080p|720p|480p|2160p|4K)', re.IGNORECASE)
+_PARENS_RE = re.compile(r'\(.*?\)')
+_TRAILING_YEAR_RE = re.compile(r'[\.\s]+(?:19|20)\d{2}$')
+_TRAILING_DASH_RE = re.compile(r'[-\s]+$')
+
+# group_movies_by_title: "Title (2024)" or "Title.2024"
+_MOVIE_TITLE_RE = re.compile(r'^(.+?)([\s\.](19|20)\d{2}|[\s\.](720|1080|2160)p|$)', re.IGNORECASE)
+
+# normalize_movie_title
+_OPT_PAREN_YEAR_RE = re.compile(r'\(?((19|20)\d{2})\)?')
+_MOVIE_TAGS_RE = re.compile(r'[\.\s]+(1080p|720p|480p|2160p|4K|HDRip|BRRip|BluRay|WEB-DL|WEBRip|HDTV|x264|x265|HEVC|AAC|DTS)', re.IGNORECASE)
+_PAREN_YEAR_RE = re.compile(r'\((?:19|20)\d{2}\)')
+_PAREN_GROUP_RE = re.compile(r'\([^)]*\)')
+_QUOTES_RE = re.compile(r'[:\'"''""`]')
+
+# clean_display_title
+_SPACED_BRACKETS_RE = re.compile(r'\s*\[.*?\]')
+_TITLE_YEAR_RE = re.compile(r'[\s\(]+((?:19[2-9]\d|20[0-2]\d))(?:[\s\)\]]|$)')
+_TRAILING_PUNCT_RE = re.compile(r'[\s\-:]+$')
+_DISPLAY_TITLE_YEAR_RE = re.compile(r'(.*?)\s*\((\d{4})\)\s*', re.DOTALL)  # "Title (Year)"
+_COMBINED_YEAR_RE = re.compile(r'\((\d{4})\)')
+
+# Residual tech specs left in already-processed names, in one pass
+# (e.g., "Nuremberg 5 1" from "Nuremberg 5.1" where dots were already replaced).
+# The trailing boundary is a lookahead so back-to-back markers ("Nf Ma") all match.
+_RESIDUAL_RE = re.compile(
+    r'\s+(?:'
+    r'5\s*1|7\s*1|2\s*0'       # 5.1 / 7.1 / 2.0 audio -> " 5 1"
+    r'|H\s*26\d?'              # H.264/H.265 -> "H 264" or "H 26"
+    r'|Ddp\d?\s*1?'            # DDP5.1 -> "Ddp5 1"
+    r'|Dd5?\s*1?'              # DD5.1 -> "Dd5 1" or "Dd 5 1"
+    r'|Nf|Ma|Hc'               # Netflix / MA / hardcoded markers
+    r'|\d+Bits?'               # 10Bits, 8Bits
+    r'|Chinese|Korean|En'      # Language markers
+    r')(?=\s|$)',
+    re.IGNORECASE,
+)
+
+# Common title case fixes (whole words after the first)
+_SMALL_WORDS = {'Of': 'of', 'A': 'a', 'An': 'an', 'And': 'and', 'In': 'in',
+                'On': 'on', 'To': 'to', 'For': 'for', 'At': 'at'}
+
+# Fallback: title ends before the first tech marker
+_TECH_MARKER_RE = re.compile(
+    r'\b(?:1080p|720p|2160p|480p|4K'
+    r'|HDRip|WEBRip|WEB-DL|BluRay|BRRip'
+    r'|HDTV|CAM|TS|TC'
+    r'|x264|x265|HEVC|H\s*264|H\s*265)\b',
+    re.IGNORECASE,
+)
+
 # ═══════════════════════════════════════════════════════════════
 # SSL AND HTTP UTILITIES
 # ═══════════════════════════════════════════════════════════════
@@ -58,67 +144,317 @@ def create_ssl_context():
     ctx.verify_mode = ssl.CERT_NONE
     return ctx
 
-def fetch_url(url: str, timeout: int = TIMEOUT) -> Optional[str]:
-    """Fetch URL with retries and gzip support."""
-    import gzip
-    import io
-    
+# Built once: loading the default CA store costs more than a request reuse
+_SSL_CONTEXT = create_ssl_context()
+
+# Keep-alive connections, one per (scheme, host) per thread. Catalog workers
+# hit the same few hosts over and over, so only the first call pays TCP+TLS.
+_local = threading.local()
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+_MAX_REDIRECTS = 5
+
+# HTTP(S)_PROXY / NO_PROXY, read the same way urllib.request does
+_PROXIES = urllib.request.getproxies()
+
+@lru_cache(maxsize=64)
+def _proxy_for(scheme: str, host: str) -> Optional[urllib.parse.SplitResult]:
+    """Proxy to reach scheme://host through, or None to connect directly."""
+    proxy = _PROXIES.get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    if '://' not in proxy:
+        proxy = 'http://' + proxy
+    return urllib.parse.urlsplit(proxy)
+
+def _proxy_headers(proxy: urllib.parse.SplitResult) -> Dict[str, str]:
+    """Proxy-Authorization for a proxy URL with credentials, else nothing."""
+    if not proxy.username:
+        return {}
+    creds = f"{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or '')}"
+    return {'Proxy-Authorization': 'Basic ' + base64.b64encode(creds.encode()).decode('ascii')}
+
+def _get_connection(scheme: str, host: str, timeout: float) -> http.client.HTTPConnection:
+    """Return this thread's persistent connection to scheme://host."""
+    pool = getattr(_local, 'pool', None)
+    if pool is None:
+        pool = _local.pool = {}
+    conn = pool.get((scheme, host))
+    if conn is None:
+        proxy = _proxy_for(scheme, host)
+        if scheme == 'https':
+            if proxy:
+                # CONNECT tunnel through the proxy; TLS runs end to end inside it
+                conn = http.client.HTTPSConnection(proxy.hostname, proxy.port, timeout=timeout, context=_SSL_CONTEXT)
+                conn.set_tunnel(host, headers=_proxy_headers(proxy))
+            else:
+                conn = http.client.HTTPSConnection(host, timeout=timeout, context=_SSL_CONTEXT)
+        elif proxy:
+            # Plain HTTP proxies take absolute-form requests (see http_get)
+            conn = http.client.HTTPConnection(proxy.hostname, proxy.port, timeout=timeout)
+        else:
+            conn = http.client.HTTPConnection(host, timeout=timeout)
+        pool[(scheme, host)] = conn
+    else:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+    return conn
+
+def _drop_connection(scheme: str, host: str):
+    """Close and forget this thread's connection to scheme://host."""
+    conn = getattr(_local, 'pool', {}).pop((scheme, host), None)
+    if conn is not None:
+        conn.close()
+
+def http_get(url: str, timeout: float = TIMEOUT,
+             headers: Dict[str, str] = HEADERS) -> Tuple[http.client.HTTPResponse, bytes]:
+    """GET url over a pooled connection, following redirects. Returns (response, body)."""
+    for _ in range(_MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        scheme, host = parts.scheme, parts.netloc
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        request_headers = headers
+        proxy = _proxy_for(scheme, host) if scheme == 'http' else None
+        if proxy:
+            path = f"http://{host}{path}"
+            request_headers = {**headers, **_proxy_headers(proxy)}
+        for attempt in range(2):
+            conn = _get_connection(scheme, host, timeout)
+            reused = conn.sock is not None
+            try:
+                conn.request('GET', path, headers=request_headers)
+                resp = conn.getresponse()
+                body = resp.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # Server dropped an idle keep-alive connection: reconnect once
+                _drop_connection(scheme, host)
+                if reused and attempt == 0:
+                    continue
+                raise
+            except Exception:
+                _drop_connection(scheme, host)
+                raise
+        location = resp.getheader('Location')
+        if resp.status in _REDIRECT_CODES and location:
+            url = urllib.parse.urljoin(url, location)
+            continue
+        # 304 only comes back for conditional requests (fetch_url_revalidated)
+        if resp.status != 304 and not 200 <= resp.status < 300:
+            raise http.client.HTTPException(f"HTTP {resp.status} for {url}")
+        return resp, body
+    raise http.client.HTTPException(f"Too many redirects for {url}")
+
+def fetch_response(url: str, timeout: int = TIMEOUT,
+                   headers: Dict[str, str] = HEADERS) -> Optional[Tuple[http.client.HTTPResponse, str]]:
+    """Fetch URL with retries and gzip support. Returns (response, text)."""
     for attempt in range(MAX_RETRIES):
         try:
-            req = urllib.request.Request(url, headers=HEADERS)
-            ctx = create_ssl_context()
-            with urllib.request.urlopen(req, timeout=timeout, context=ctx) as resp:
-                data = resp.read()
-                # Handle gzip encoding
-                encoding = resp.headers.get('Content-Encoding', '')
-                if 'gzip' in encoding:
-                    data = gzip.decompress(data)
-                elif 'deflate' in encoding:
-                    import zlib
-                    data = zlib.decompress(data)
-                return data.decode('utf-8')
+            resp, data = http_get(url, timeout, headers)
+            # Handle gzip encoding
+            encoding = resp.getheader('Content-Encoding', '')
+            if 'gzip' in encoding:
+                data = gzip.decompress(data)
+            elif 'deflate' in encoding:
+                data = zlib.decompress(data)
+            return resp, data.decode('utf-8')
         except Exception:
             if attempt < MAX_RETRIES - 1:
                 time.sleep(0.5 * (attempt + 1))
             continue
     return None
 
+def fetch_url(url: str, timeout: int = TIMEOUT) -> Optional[str]:
+    """Fetch URL with retries and gzip support."""
+    result = fetch_response(url, timeout)
+    return result[1] if result else None
+
+def fetch_url_revalidated(url: str, timeout: int = TIMEOUT) -> Optional[str]:
+    """
+    fetch_url for feeds that are re-read on every run (the precompiled TPB lists).
+    The last body is kept on disk with its ETag/Last-Modified and the next fetch
+    is a conditional GET, so an unchanged feed costs a 304 instead of the body.
+    """
+    cache_key = get_cache_key('http', url)
+    entry = None
+    headers = HEADERS
+    if not REFRESH_CACHE:
+        try:
+            with open(_CACHE_PREFIX + cache_key + '.json', encoding='utf-8') as f:
+                entry = json.loads(f.read())
+            headers = dict(HEADERS)
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        except (OSError, ValueError, AttributeError):
+            entry = None
+            headers = HEADERS
+
+    result = fetch_response(url, timeout, headers)
+    if not result:
+        _degraded.set()
+        return None
+    resp, text = result
+    if resp.status == 304 and entry is not None:
+        return entry.get('body')
+
+    etag, last_modified = resp.getheader('ETag'), resp.getheader('Last-Modified')
+    if etag or last_modified:
+        set_cache(cache_key, json.dumps({'etag': etag, 'last_modified': last_modified, 'body': text}))
+    return text
+
+# Set when a source gave up (every mirror failed, a search errored, a phase ran
+# out of time): this run's catalog is incomplete and must not be cached
+_degraded = threading.Event()
+
+# Mirror that answered last, per domain list: later calls go straight to it
+# (and its keep-alive connection) instead of probing every mirror again
+_mirror_winner = {}
+
+def fetch_json_from_mirrors(domains: List[str], path: str, timeout: int = TIMEOUT,
+                            accept=None) -> Optional[object]:
+    """
+    GET https://<domain><path> and return the parsed JSON of the first mirror
+    whose response parses (and passes accept(data), if given).
+    The last winner is tried first; the rest are probed concurrently, so a
+    blocked mirror costs one timeout instead of one timeout per mirror.
+    """
+    key = tuple(domains)
+
+    def fetch(domain):
+        response = fetch_url(f"https://{domain}{path}", timeout=timeout)
+        if not response:
+            return None
+        try:
+            data = json.loads(response)
+        except ValueError:
+            return None  # ISP block pages and captchas are not JSON
+        if accept is not None and not accept(data):
+            return None
+        return data
+
+    winner = _mirror_winner.get(key)
+    if winner:
+        data = fetch(winner)
+        if data is not None:
+            return data
+
+    # Daemon threads: a hung mirror must not hold up interpreter exit
+    candidates = [d for d in domains if d != winner]
+    results = queue.Queue()
+    for domain in candidates:
+        threading.Thread(target=lambda d=domain: results.put((d, fetch(d))), daemon=True).start()
+    for _ in candidates:
+        domain, data = results.get()
+        if data is not None:
+            _mirror_winner[key] = domain
+            return data
+    _degraded.set()
+    return None
+
+def prewarm_dns(hosts: List[str]):
+    """
+    Resolve hosts on background threads, so the first real request to each
+    finds the answer in the system resolver cache instead of waiting on DNS.
+    """
+    def resolve(host):
+        try:
+            socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+        except OSError:
+            pass  # Offline or blocked mirror: the real request reports it
+
+    for host in hosts:
+        threading.Thread(target=resolve, args=(host,), daemon=True).start()
+
+def search_workers(jobs: int) -> int:
+    """Pool size for `jobs` searches: SEARCH_WORKERS or the env override, capped at jobs."""
+    workers = SEARCH_WORKERS
+    env = os.environ.get('TERMFLIX_FETCH_WORKERS', '')
+    try:
+        if int(env) > 0:
+            workers = int(env)
+    except ValueError:
+        pass
+    return max(1, min(workers, jobs))
+
 # ═══════════════════════════════════════════════════════════════
 # CACHE UTILITIES
 # ═══════════════════════════════════════════════════════════════
 
 def get_cache_key(prefix: str, query: str) -> str:
-    """Generate cache key."""
-    return hashlib.md5(f"{prefix}:{query}".encode()).hexdigest()[:16]
+    """Generate cache key (16 hex chars, same shape as the old truncated MD5)."""
+    return hashlib.blake2b(f"{prefix}:{query}".encode(), digest_size=8).hexdigest()
 
-def get_cached(key: str) -> Optional[str]:
-    """Get cached result if valid."""
+def get_cached(key: str, ttl: int = CACHE_TTL) -> Optional[str]:
+    """Get cached result if younger than ttl seconds."""
     if REFRESH_CACHE:
         return None
         
-    cache_file = CACHE_DIR / f"{key}.json"
-    if cache_file.exists():
-        try:
-            mtime = cache_file.stat().st_mtime
-            if time.time() - mtime < CACHE_TTL:
-                return cache_file.read_text()
-        except:
-            pass
+    cache_file = _CACHE_PREFIX + key + '.json'
+    try:
+        # One stat answers both "exists?" and "fresh?"
+        if time.time() - os.stat(cache_file).st_mtime < ttl:
+            with open(cache_file, encoding='utf-8') as f:
+                return f.read()
+    except Exception:
+        pass
     return None
 
 def set_cache(key: str, data: str):
     """Save to cache."""
+    cache_file = _CACHE_PREFIX + key + '.json'
+    # Per-writer temp name, renamed into place: an interrupted write or two
+    # workers caching the same query never leave a truncated entry behind
+    tmp = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
     try:
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        cache_file = CACHE_DIR / f"{key}.json"
-        cache_file.write_text(data)
-    except:
-        pass
+        try:
+            f = open(tmp, 'w', encoding='utf-8')
+        except FileNotFoundError:
+            # Cache dir removed since startup (cache cleanup): recreate it
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            f = open(tmp, 'w', encoding='utf-8')
+        with f:
+            f.write(data)
+        os.replace(tmp, cache_file)
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+# Parsed entries this process has already read or written. A query repeated
+# across phases (a movie in the TPB top 100 that is also on a YTS page) skips
+# the file read and json.loads. Callers must treat results as read-only.
+_mem_cache: Dict[str, object] = {}
+
+def get_cached_json(key: str, ttl: int = CACHE_TTL) -> Optional[object]:
+    """get_cached, parsed (None on a miss or a corrupt entry)."""
+    data = _mem_cache.get(key)
+    if data is None:
+        cached = get_cached(key, ttl)
+        if cached:
+            try:
+                data = _mem_cache[key] = json.loads(cached)
+            except ValueError:
+                return None  # Corrupt cache entry: refetch
+    return data
+
+def set_cache_json(key: str, data: object):
+    """set_cache for a JSON-serializable result, remembered in memory too."""
+    _mem_cache[key] = data
+    set_cache(key, json.dumps(data))
 
 # ═══════════════════════════════════════════════════════════════
 # YTS API
 # ═══════════════════════════════════════════════════════════════
 
+def _yts_ok(data) -> bool:
+    """YTS answers every query with a status envelope."""
+    return isinstance(data, dict) and data.get('status') == 'ok'
+
 def fetch_yts_movies(limit: int = 50, page: int = 1, sort_by: str = 'date_added', 
                      query_term: str = None, genre: str = None, min_rating: int = 0,
                      order_by: str = 'desc') -> List[Dict]:
@@ -143,79 +479,60 @@ def fetch_yts_movies(limit: int = 50, page: int = 1, sort_by: str = 'date_added'
        
     # Check cache
     cache_key = get_cache_key('yts_list', f"{limit}_{page}_{yts_sort}_{query_term}_{genre}_{min_rating}_{order_by}")
-    cached = get_cached(cache_key)
-    if cached:
-        try:
-            return json.loads(cached)
-        except:
-            pass
+    cached = get_cached_json(cache_key, CACHE_TTLS['yts_list'])
+    if cached is not None:
+        return cached
 
-    for domain in YTS_DOMAINS:
-        url = f"https://{domain}/api/v2/list_movies.json?limit={limit}&page={page}&sort_by={yts_sort}&order_by={order_by}"
-        
-        if query_term:
-            url += f"&query_term={urllib.parse.quote_plus(str(query_term))}"
-        if genre:
-            url += f"&genre={urllib.parse.quote_plus(genre)}"
-        if min_rating > 0:
-            url += f"&minimum_rating={min_rating}"
-        
-        response = fetch_url(url)
-        if not response:
-            continue
-        
-        try:
-            data = json.loads(response)
-            if data.get('status') == 'ok':
-                movies = data.get('data', {}).get('movies', [])
-                set_cache(cache_key, json.dumps(movies))
-                return movies
-        except:
-            continue
-    
-    return []
+    path = f"/api/v2/list_movies.json?limit={limit}&page={page}&sort_by={yts_sort}&order_by={order_by}"
+    if query_term:
+        path += f"&query_term={urllib.parse.quote_plus(str(query_term))}"
+    if genre:
+        path += f"&genre={urllib.parse.quote_plus(genre)}"
+    if min_rating > 0:
+        path += f"&minimum_rating={min_rating}"
+
+    data = fetch_json_from_mirrors(YTS_DOMAINS, path, accept=_yts_ok)
+    if data is None:
+        return []
+    try:
+        movies = data.get('data', {}).get('movies', [])
+        set_cache_json(cache_key, movies)
+        return movies
+    except Exception:
+        return []
 
 def search_yts(query: str) -> List[Dict]:
     """Search YTS for additional torrents."""
     cache_key = get_cache_key('yts_search', query)
-    cached = get_cached(cache_key)
-    if cached:
-        try:
-            return json.loads(cached)
-        except:
-            pass
+    cached = get_cached_json(cache_key)
+    if cached is not None:
+        return cached
     
     encoded_query = urllib.parse.quote_plus(query)
-    
-    for domain in YTS_DOMAINS:
-        url = f"https://{domain}/api/v2/list_movies.json?query_term={encoded_query}&limit=10"
-        response = fetch_url(url, timeout=5)
-        if not response:
-            continue
-        
-        try:
-            data = json.loads(response)
-            if data.get('status') == 'ok':
-                movies = data.get('data', {}).get('movies', [])
-                torrents = []
-                for movie in movies:
-                    for t in movie.get('torrents', []):
-                        if not t.get('hash'):
-                            continue
-                        torrents.append({
-                            'source': 'YTS',
-                            'hash': t['hash'].lower(),
-                            'quality': t.get('quality', 'Unknown'),
-                            'size': t.get('size', 'N/A'),
-                            'seeds': int(t.get('seeds', 0)),
-                            'magnet': f"magnet:?xt=urn:btih:{t['hash']}"
-                        })
-                set_cache(cache_key, json.dumps(torrents))
-                return torrents
-        except:
-            continue
-    
-    return []
+    path = f"/api/v2/list_movies.json?query_term={encoded_query}&limit=10"
+    data = fetch_json_from_mirrors(YTS_DOMAINS, path, timeout=5, accept=_yts_ok)
+    if data is None:
+        return []
+
+    try:
+        movies = data.get('data', {}).get('movies', [])
+        torrents = []
+        for movie in movies:
+            for t in movie.get('torrents', []):
+                if not t.get('hash'):
+                    continue
+                torrents.append({
+                    'source': 'YTS',
+                    'hash': t['hash'].lower(),
+                    'quality': t.get('quality', 'Unknown'),
+                    'size': t.get('size', 'N/A'),
+                    'seeds': int(t.get('seeds', 0)),
+                    'magnet': f"magnet:?xt=urn:btih:{t['hash']}"
+                })
+        set_cache_json(cache_key, torrents)
+        return torrents
+    except Exception:
+        return []
 
 def parse_yts_torrents(movie: Dict) -> List[Dict]:
     """Parse torrents from YTS movie entry."""
@@ -263,12 +580,9 @@ def search_tpb(query: str, category: int = 207) -> List[Dict]:
     """Search TPB for torrents matching query (Default: HD Movies 207)."""
     # Check cache first
     cache_key = get_cache_key(f'tpb_{category}', query)
-    cached = get_cached(cache_key)
-    if cached:
-        try:
-            return json.loads(cached)
-        except:
-            pass
+    cached = get_cached_json(cache_key)
+    if cached is not None:
+        return cached
     
     encoded_query = urllib.parse.quote_plus(query)
     url = f"{TPB_SEARCH_URL}?q={encoded_query}&cat={category}"
@@ -276,6 +590,7 @@ def search_tpb(query: str, category: int = 207) -> List[Dict]:
     # Use curl for TPB (better at avoiding rate limits)
     response = fetch_url_curl(url, timeout=8)
     if not response:
+        _degraded.set()
         return []
     
     try:
@@ -293,9 +608,6 @@ def search_tpb(query: str, category: int = 207) -> List[Dict]:
                 continue
             
             seeders = int(item.get('seeders', 0))
-            size_bytes = int(item.get('size', 0))
-            size_mb = size_bytes // (1024 * 1024)
-            
             # Determine quality from name
             name = item.get('name', '')
             quality = extract_quality(name)
@@ -304,25 +616,31 @@ def search_tpb(query: str, category: int = 207) -> List[Dict]:
                 'source': 'TPB',
                 'hash': info_hash.lower(),
                 'quality': quality,
-                'size': f"{size_mb}MB" if size_mb < 1024 else f"{size_mb/1024:.1f}GB",
+                'size': format_size(int(item.get('size', 0))),
                 'seeds': seeders,
                 'magnet': f"magnet:?xt=urn:btih:{info_hash}",
                 'name': name
             })
         
         # Cache results
-        set_cache(cache_key, json.dumps(torrents))
+        set_cache_json(cache_key, torrents)
         return torrents
         
     except Exception:
+        _degraded.set()
         return []
 
+@lru_cache(maxsize=4096)
 def extract_quality(name: str) -> str:
-    """Extract quality from torrent name."""
+    """
+    Extract quality from torrent name, highest tier first.
+    Plain substring checks: a single regex alternation would return the
+    leftmost token ("1080p ... 2160p" -> 1080p) instead of the best one.
+    """
     name_lower = name.lower()
-    if any(q in name_lower for q in ['2160p', '4k', 'uhd']):
+    if '2160p' in name_lower or '4k' in name_lower or 'uhd' in name_lower:
         return '4K'
-    if any(q in name_lower for q in ['1080p', 'fhd']):
+    if '1080p' in name_lower or 'fhd' in name_lower:
         return '1080p'
     if '720p' in name_lower:
         return '720p'
@@ -330,6 +648,11 @@ def extract_quality(name: str) -> str:
         return '480p'
     return 'Unknown'
 
+def format_size(size_bytes: int) -> str:
+    """Format a byte count the way COMBINED lines show it (whole MB, or GB to one decimal)."""
+    size_mb = size_bytes // (1024 * 1024)
+    return f"{size_mb}MB" if size_mb < 1024 else f"{size_mb/1024:.1f}GB"
+
 # ═══════════════════════════════════════════════════════════════
 # EZTV API (Dedicated TV Shows Source)
 # ═══════════════════════════════════════════════════════════════
@@ -343,26 +666,16 @@ def fetch_eztv_shows(limit: int = 50, page: int = 1) -> List[Dict]:
     Returns list of torrent dicts with normalized field names.
     """
     cache_key = get_cache_key('eztv_shows', f'{limit}_{page}')
-    cached = get_cached(cache_key)
-    if cached:
-        try:
-            return json.loads(cached)
-        except:
-            pass
+    cached = get_cached_json(cache_key, CACHE_TTLS['eztv_shows'])
+    if cached is not None:
+        return cached
     
-    # Try each EZTV domain until one works
-    response = None
-    for domain in EZTV_DOMAINS:
-        url = f"https://{domain}/api/get-torrents?limit={limit}&page={page}"
-        response = fetch_url(url, timeout=6)
-        if response:
-            break  # Found a working domain
-    
-    if not response:
+    # Probe the EZTV mirrors until one answers
+    data = fetch_json_from_mirrors(EZTV_DOMAINS, f"/api/get-torrents?limit={limit}&page={page}", timeout=6)
+    if data is None:
         return []
     
     try:
-        data = json.loads(response)
         torrents_raw = data.get('torrents', [])
         
         results = []
@@ -382,7 +695,7 @@ def fetch_eztv_shows(limit: int = 50, page: int = 1) -> List[Dict]:
             })
         
         if results:
-            set_cache(cache_key, json.dumps(results))
+            set_cache_json(cache_key, results)
         return results
         
     except Exception:
@@ -391,34 +704,23 @@ def fetch_eztv_shows(limit: int = 50, page: int = 1) -> List[Dict]:
 
 def search_eztv(query: str) -> List[Dict]:
     """Search EZTV for TV show torrents by IMDB ID."""
-    cache_key = get_cache_key('eztv_search', query)
-    cached = get_cached(cache_key)
-    if cached:
-        try:
-            return json.loads(cached)
-        except:
-            pass
-    
     # EZTV doesn't have a text search API - only IMDB-based search works
-    if query.startswith('tt'):
-        imdb_num = query.replace('tt', '')
-    else:
+    imdb_num = query[2:]
+    if not query.startswith('tt') or not imdb_num.isdigit():
         # No direct text search, return empty (will rely on TPB for text search)
         return []
     
-    # Try each EZTV domain until one works
-    response = None
-    for domain in EZTV_DOMAINS:
-        url = f"https://{domain}/api/get-torrents?imdb_id={imdb_num}&limit=50"
-        response = fetch_url(url, timeout=6)
-        if response:
-            break
+    cache_key = get_cache_key('eztv_search', query)
+    cached = get_cached_json(cache_key, CACHE_TTLS['eztv_search'])
+    if cached is not None:
+        return cached
     
-    if not response:
+    # Probe the EZTV mirrors until one answers
+    data = fetch_json_from_mirrors(EZTV_DOMAINS, f"/api/get-torrents?imdb_id={imdb_num}&limit=50", timeout=6)
+    if data is None:
         return []
     
     try:
-        data = json.loads(response)
         torrents_raw = data.get('torrents', [])
         
         results = []
@@ -438,7 +740,7 @@ def search_eztv(query: str) -> List[Dict]:
             })
         
         if results:
-            set_cache(cache_key, json.dumps(results))
+            set_cache_json(cache_key, results)
         return results
         
     except Exception:
@@ -449,14 +751,56 @@ def search_eztv(query: str) -> List[Dict]:
 # TPB FALLBACK (when YTS is unavailable)
 # ═══════════════════════════════════════════════════════════════
 
+def fetch_tpb_category(cat: int, count: int = 100, timeout: int = 8) -> List[Dict]:
+    """Fetch TPB top100 for given category."""
+    url = f'https://apibay.org/precompiled/data_top100_{cat}.json'
+    response = fetch_url_revalidated(url, timeout=timeout)
+    if not response:
+        return []
+    try:
+        data = json.loads(response)
+        items = []
+        for item in data[:count]:
+            info_hash = item.get('info_hash', '')
+            if info_hash and info_hash != '0' * 40:
+                item['source'] = 'TPB'
+                items.append(item)
+        return items
+    except Exception:
+        return []
+
+
 def fetch_tpb_fallback_catalog(limit: int = 50, category: int = 207) -> List[str]:
     """
     Fallback: Fetch movies directly from TPB top100 (Default: HD Movies 207).
     Returns COMBINED format strings.
     """
     # 201=Movies, 207=HD Movies, 205=TV Shows, 208=HD TV Shows
+    if category in [205, 208]: # TV Shows Categories
+        # PARALLEL MULTI-SOURCE FETCH
+        # The requested TPB category, TPB non-HD and EZTV all start at once:
+        # wall-clock is the slowest of the three, not the first plus the rest
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(fetch_tpb_category, category, limit * 2, 10),
+                executor.submit(fetch_tpb_category, 205),
+                executor.submit(fetch_eztv_shows, 100),
+            ]
+            all_items = []
+            # Collect in submission order so grouping input is deterministic
+            for future in futures:
+                try:
+                    all_items.extend(future.result(timeout=12))
+                except Exception:
+                    _degraded.set()  # Source failed, continue with others
+        
+        try:
+            return group_shows_by_series(all_items, limit)
+        except Exception:
+            return []
+
     TPB_TOP100_URL = f'https://apibay.org/precompiled/data_top100_{category}.json'
-    response = fetch_url(TPB_TOP100_URL, timeout=10)
+    response = fetch_url_revalidated(TPB_TOP100_URL, timeout=10)
     if not response:
         return []
     
@@ -464,78 +808,30 @@ def fetch_tpb_fallback_catalog(limit: int = 50, category: int = 207) -> List[str
         data = json.loads(response)
         raw_items = []
         
-        # Regex to detect TV Shows (Season/Episode patterns)
-        tv_pattern = re.compile(r'(S\d{1,2}E\d{1,2}|Season\s*\d+|Complete\s*Series|(\d+)x(\d+))', re.IGNORECASE)
+        # Strict Content Filtering: If we are asking for Movies (201/207), 
+        # reject anything looking like a TV show.
+        is_tv = _TV_RE.search if category in [201, 207, 209, 202] else None
         
-        for item in data[:limit * 2]: # Fetch more to allow for filtering/grouping
+        # Fill up to limit survivors, however many entries the filter drops
+        for item in data:
             info_hash = item.get('info_hash', '')
             if not info_hash or info_hash == '0' * 40:
                 continue
             
-            name = item.get('name', 'Unknown')
-            
-            # Strict Content Filtering: If we are asking for Movies (201/207), 
-            # reject anything looking like a TV show.
-            is_tv = tv_pattern.search(name)
-            if category in [201, 207, 209, 202] and is_tv:
+            if is_tv and is_tv(item.get('name', 'Unknown')):
                 continue
             
             raw_items.append(item)
+            if len(raw_items) >= limit:
+                break
 
-        if category in [205, 208]: # TV Shows Categories
-            # PARALLEL MULTI-SOURCE FETCH
-            # Fetch from TPB HD, TPB non-HD, and EZTV concurrently
-            all_items = []
-            
-            def fetch_tpb_category(cat: int) -> List[Dict]:
-                """Fetch TPB top100 for given category."""
-                url = f'https://apibay.org/precompiled/data_top100_{cat}.json'
-                response = fetch_url(url, timeout=8)
-                if not response:
-                    return []
-                try:
-                    data = json.loads(response)
-                    items = []
-                    for item in data[:100]:
-                        info_hash = item.get('info_hash', '')
-                        if info_hash and info_hash != '0' * 40:
-                            item['source'] = 'TPB'
-                            items.append(item)
-                    return items
-                except:
-                    return []
-            
-            # Add TPB HD items we already fetched
-            for item in raw_items:
-                item['source'] = 'TPB'
-            all_items.extend(raw_items)
-            
-            # Parallel fetch: TPB non-HD + EZTV
-            with ThreadPoolExecutor(max_workers=3) as executor:
-                futures = {
-                    executor.submit(fetch_tpb_category, 205): 'TPB_NonHD',
-                    executor.submit(fetch_eztv_shows, 100): 'EZTV',
-                }
-                for future in as_completed(futures, timeout=12):
-                    source_name = futures[future]
-                    try:
-                        items = future.result(timeout=10)
-                        if items:
-                            all_items.extend(items)
-                    except Exception:
-                        pass  # Source failed, continue with others
-            
-            return group_shows_by_series(all_items, limit)
-        
         # Standard movie processing for TPB fallback
         results = []
-        for item in raw_items[:limit]:
+        for item in raw_items:
             info_hash = item.get('info_hash', '')
             name = item.get('name', 'Unknown')
             seeders = int(item.get('seeders', 0))
-            size_bytes = int(item.get('size', 0))
-            size_mb = size_bytes // (1024 * 1024)
-            size_str = f"{size_mb}MB" if size_mb < 1024 else f"{size_mb/1024:.1f}GB"
+            size_str = format_size(int(item.get('size', 0)))
             quality = extract_quality(name)
             magnet = f"magnet:?xt=urn:btih:{info_hash}"
             imdb = item.get('imdb', 'N/A')
@@ -558,35 +854,36 @@ def fetch_tpb_fallback_catalog(limit: int = 50, category: int = 207) -> List[str
     except Exception:
         return []
 
+@lru_cache(maxsize=4096)
 def normalize_series_name(name: str) -> str:
     """Normalize series name for consistent grouping."""
     # Primary strategy: Extract just the series name BEFORE episode/season markers
     # Pattern matches: "Show Name S01E01...", "Show.Name.S01...", "Show Name 1x01..."
     
     # Try to extract series name before episode marker
-    series_match = re.match(r'^(.+?)[\.\s]+(?:S\d{1,2}(?:E\d{1,4})?|\d+x\d+|Season\s*\d+)', name, re.IGNORECASE)
+    series_match = _SERIES_CUT_RE.match(name)
     if series_match:
         name = series_match.group(1)
     
     # Remove release group at end (e.g., -MeGusta, -ETHEL)
-    name = re.sub(r'-[A-Za-z0-9]+$', '', name)
+    name = _RELEASE_GROUP_RE.sub('', name)
     
     # Remove quality/codec patterns that might still be in prefix
-    name = re.sub(r'[\.\s]+(1080p|720p|480p|2160p|4K)', '', name, flags=re.IGNORECASE)
+    name = _SERIES_QUALITY_RE.sub('', name)
     
     # Remove bracketed/parenthesized content
-    name = re.sub(r'\[.*?\]', '', name)
-    name = re.sub(r'\(.*?\)', '', name)
+    name = _BRACKETS_RE.sub('', name)
+    name = _PARENS_RE.sub('', name)
     
     # Remove trailing year (e.g., "Show Name 2024")
-    name = re.sub(r'[\.\s]+(?:19|20)\d{2}$', '', name)
+    name = _TRAILING_YEAR_RE.sub('', name)
     
     # Replace dots/underscores with spaces
     name = name.replace('.', ' ').replace('_', ' ')
     
     # Clean up whitespace and trailing dashes
-    name = re.sub(r'[-\s]+$', '', name)
-    name = re.sub(r'\s+', ' ', name).strip()
+    name = _TRAILING_DASH_RE.sub('', name)
+    name = _WS_RE.sub(' ', name).strip()
     
     # Title case for consistency
     name = name.title()
@@ -598,6 +895,7 @@ def group_shows_by_series(items: List[Dict], limit: int) -> List[str]:
     """Group individual TV torrents by series title."""
     from collections import defaultdict
     series_groups = defaultdict(list)
+    max_seeds = {}
     
     for item in items:
         raw_name = item.get('name', 'Unknown')
@@ -608,29 +906,27 @@ def group_shows_by_series(items: List[Dict], limit: int) -> List[str]:
             continue
             
         series_groups[series_name].append(item)
+        # Track each series' best seed count while grouping (sort key below)
+        seeds = int(item.get('seeders', item.get('seeds', 0)))
+        if series_name not in max_seeds or seeds > max_seeds[series_name]:
+            max_seeds[series_name] = seeds
     
     results = []
     # Sort series by the highest seeds in any of its torrents
-    sorted_series = sorted(series_groups.items(), 
-                          key=lambda x: max(int(i.get('seeders', i.get('seeds', 0))) for i in x[1]), 
-                          reverse=True)
+    sorted_series = sorted(series_groups.items(), key=lambda x: max_seeds[x[0]], reverse=True)
     
+    quality_of = extract_quality
     for series_name, torrents in sorted_series[:limit]:
-        # Aggregate data for Stage 1
-        # Handle both TPB format (info_hash) and EZTV format (hash)
-        sources = [t.get('source', 'TPB') for t in torrents]
-        qualities = [extract_quality(t.get('name', '')) for t in torrents]
-        seeds = [str(t.get('seeders', t.get('seeds', 0))) for t in torrents]
-        sizes = []
+        # Aggregate data for Stage 1 in one pass over the group
+        # Handle both TPB format (info_hash/seeders/size) and EZTV format (hash/seeds/size_bytes)
+        sources, qualities, seeds, sizes, magnets = [], [], [], [], []
         for t in torrents:
-            size_bytes = int(t.get('size', t.get('size_bytes', 0)))
-            size_mb = size_bytes // (1024 * 1024)
-            sizes.append(f"{size_mb}MB" if size_mb < 1024 else f"{size_mb/1024:.1f}GB")
-        
-        # Handle both hash field names
-        magnets = []
-        for t in torrents:
-            h = t.get('info_hash', t.get('hash', ''))
+            get = t.get
+            sources.append(get('source', 'TPB'))
+            qualities.append(quality_of(get('name', '')))
+            seeds.append(str(get('seeders', get('seeds', 0))))
+            sizes.append(format_size(int(get('size', get('size_bytes', 0)))))
+            h = get('info_hash', get('hash', ''))
             if h:
                 magnets.append(f"magnet:?xt=urn:btih:{h}")
         
@@ -655,49 +951,50 @@ def group_shows_by_series(items: List[Dict], limit: int) -> List[str]:
         
     return results
 
+@lru_cache(maxsize=4096)
+def movie_group_key(name: str) -> str:
+    """Grouping key for a movie torrent name: cleaned "Title (Year)"."""
+    # Note: For movies we usually want to group by exact Title + Year if possible
+    match = _MOVIE_TITLE_RE.search(name)
+    if match:
+        clean_name = match.group(1).replace('.', ' ').strip()
+        # Extract year if present in original name
+        year_match = _YEAR_RE.search(name)
+        group_key = f"{clean_name} ({year_match.group(0)})" if year_match else clean_name
+    else:
+        group_key = name
+
+    return clean_display_title(group_key) or group_key
+
 def group_movies_by_title(items: List[Dict], limit: int) -> List[str]:
     """Group individual movie torrents from TPB by title."""
     from collections import defaultdict
     movie_groups = defaultdict(list)
-    
-    # Pattern to extract title and optional year: "Title (2024)" or "Title.2024"
-    # Note: For movies we usually want to group by exact Title + Year if possible
-    movie_pattern = re.compile(r'^(.+?)([\s\.](19|20)\d{2}|[\s\.](720|1080|2160)p|$)', re.IGNORECASE)
+    max_seeds = {}
     
     for item in items:
-        name = item.get('name', 'Unknown')
-        match = movie_pattern.search(name)
-        if match:
-            clean_name = match.group(1).replace('.', ' ').strip()
-            # Extract year if present in original name
-            year_match = re.search(r'(19|20)\d{2}', name)
-            group_key = f"{clean_name} ({year_match.group(0)})" if year_match else clean_name
-        else:
-            group_key = name
-
-        cleaned = clean_display_title(group_key)
-        if cleaned:
-            group_key = cleaned
-            
+        group_key = movie_group_key(item.get('name', 'Unknown'))
         movie_groups[group_key].append(item)
+        seeds = int(item.get('seeders', 0))
+        if group_key not in max_seeds or seeds > max_seeds[group_key]:
+            max_seeds[group_key] = seeds
     
     results = []
     # Sort by highest seeds
-    sorted_movies = sorted(movie_groups.items(), 
-                           key=lambda x: max(int(i.get('seeders', 0)) for i in x[1]), 
-                           reverse=True)
+    sorted_movies = sorted(movie_groups.items(), key=lambda x: max_seeds[x[0]], reverse=True)
     
+    quality_of = extract_quality
     for movie_title, torrents in sorted_movies[:limit]:
         sources = ["TPB"] * len(torrents)
-        qualities = [extract_quality(t.get('name', '')) for t in torrents]
-        seeds = [str(t.get('seeders', 0)) for t in torrents]
-        sizes = []
+        # One pass over the group for every per-torrent column
+        qualities, seeds, sizes, magnets = [], [], [], []
         for t in torrents:
-            size_bytes = int(t.get('size', 0))
-            size_mb = size_bytes // (1024 * 1024)
-            sizes.append(f"{size_mb}MB" if size_mb < 1024 else f"{size_mb/1024:.1f}GB")
+            get = t.get
+            qualities.append(quality_of(get('name', '')))
+            seeds.append(str(get('seeders', 0)))
+            sizes.append(format_size(int(get('size', 0))))
+            magnets.append(f"magnet:?xt=urn:btih:{get('info_hash')}")
         
-        magnets = [f"magnet:?xt=urn:btih:{t.get('info_hash')}" for t in torrents]
         imdb = torrents[0].get('imdb', 'N/A')
         display_title = clean_display_title(movie_title) or movie_title
         
@@ -721,6 +1018,7 @@ def group_movies_by_title(items: List[Dict], limit: int) -> List[str]:
 # NEW ENRICHED CATALOG ALGORITHM
 # ═══════════════════════════════════════════════════════════════
 
+@lru_cache(maxsize=4096)
 def normalize_movie_title(name: str) -> str:
     """Normalize movie title for deduplication (lowercase, stripped, no punctuation).
     
@@ -730,21 +1028,21 @@ def normalize_movie_title(name: str) -> str:
     - Extract and append year at the end for consistency
     """
     # Extract year first (for consistent comparison)
-    year_match = re.search(r'\(?((19|20)\d{2})\)?', name)
+    year_match = _OPT_PAREN_YEAR_RE.search(name)
     year = year_match.group(1) if year_match else ''
     
     # Remove quality markers, release groups, etc.
-    name = re.sub(r'[\.\s]+(1080p|720p|480p|2160p|4K|HDRip|BRRip|BluRay|WEB-DL|WEBRip|HDTV|x264|x265|HEVC|AAC|DTS)', '', name, flags=re.IGNORECASE)
-    name = re.sub(r'-[A-Za-z0-9]+$', '', name)  # Release group
-    name = re.sub(r'\[.*?\]', '', name)  # Bracketed content
-    name = re.sub(r'\((?:19|20)\d{2}\)', '', name)  # Remove year in parens (we add back normalized)
-    name = re.sub(r'\([^)]*\)', '', name)  # Other parentheses  
+    name = _MOVIE_TAGS_RE.sub('', name)
+    name = _RELEASE_GROUP_RE.sub('', name)  # Release group
+    name = _BRACKETS_RE.sub('', name)  # Bracketed content
+    name = _PAREN_YEAR_RE.sub('', name)  # Remove year in parens (we add back normalized)
+    name = _PAREN_GROUP_RE.sub('', name)  # Other parentheses  
     
     # Remove punctuation that differs between sources (colons, apostrophes, etc.)
-    name = re.sub(r'[:\'"''""`]', '', name)  # Remove quotes and colons
+    name = _QUOTES_RE.sub('', name)  # Remove quotes and colons
     
     name = name.replace('.', ' ').replace('_', ' ')
-    name = re.sub(r'\s+', ' ', name).strip()
+    name = _WS_RE.sub(' ', name).strip()
     
     # Normalize to lowercase and append year for consistent matching
     normalized = name.lower()
@@ -754,6 +1052,7 @@ def normalize_movie_title(name: str) -> str:
     return normalized
 
 
+@lru_cache(maxsize=4096)
 def clean_display_title(name: str) -> str:
     """
     Clean TPB torrent name for display and API lookups.
@@ -772,58 +1071,34 @@ def clean_display_title(name: str) -> str:
     original = name
     
     # Step 1: Remove bracketed content like [1080p], [WEBRip], [5.1], [YTS.MX]
-    name = re.sub(r'\s*\[.*?\]', '', name)
+    name = _SPACED_BRACKETS_RE.sub('', name)
     
     # Step 2: Replace dots and underscores with spaces
     name = name.replace('.', ' ').replace('_', ' ')
     
     # Step 3: Try to find year and extract title before it
     # Pattern: look for year (1920-2029) that's followed by tech specs or end
-    year_match = re.search(r'[\s\(]+((?:19[2-9]\d|20[0-2]\d))(?:[\s\)\]]|$)', name)
+    year_match = _TITLE_YEAR_RE.search(name)
     
     if year_match:
         year = year_match.group(1)
         title = name[:year_match.start()].strip()
         
         # Clean up title - remove residual tech specs that may be in already-processed names
-        # (e.g., "Nuremberg 5 1" from "Nuremberg 5.1" where dots were already replaced)
-        residual_patterns = [
-            r'\s+5\s*1(?:\s|$)',       # 5.1 audio -> " 5 1"
-            r'\s+7\s*1(?:\s|$)',       # 7.1 audio
-            r'\s+2\s*0(?:\s|$)',       # 2.0 audio
-            r'\s+H\s*26\d?(?:\s|$)',   # H.264/H.265 -> "H 264" or "H 26"
-            r'\s+Dd5?\s*1?(?:\s|$)',   # DD5.1 -> "Dd5 1" or "Dd 5 1"
-            r'\s+Ddp\d?\s*1?(?:\s|$)', # DDP5.1 -> "Ddp5 1"
-            r'\s+Nf(?:\s|$)',          # Netflix marker
-            r'\s+Ma(?:\s|$)',          # MA marker
-            r'\s+Hc(?:\s|$)',          # HC (hardcoded) marker
-            r'\s+\d+Bits?(?:\s|$)',    # 10Bits, 8Bits
-            r'\s+Chinese(?:\s|$)',     # Language marker
-            r'\s+Korean(?:\s|$)',      # Language marker
-            r'\s+En(?:\s|$)',          # English marker
-        ]
-        for pattern in residual_patterns:
-            title = re.sub(pattern, ' ', title, flags=re.IGNORECASE)
+        title = _RESIDUAL_RE.sub(' ', title)
         
         # Clean up title
-        title = re.sub(r'\s+', ' ', title).strip()
-        title = re.sub(r'[\s\-:]+$', '', title)  # Remove trailing punctuation
+        title = _WS_RE.sub(' ', title).strip()
+        title = _TRAILING_PUNCT_RE.sub('', title)  # Remove trailing punctuation
         
         if title:
             # Title case and format
             title = title.title()
             
             # Fix common title case issues
-            title = re.sub(r'\bOf\b', 'of', title)
-            title = re.sub(r'\bThe\b', 'The', title)
-            title = re.sub(r'\bA\b', 'a', title)
-            title = re.sub(r'\bAn\b', 'an', title)
-            title = re.sub(r'\bAnd\b', 'and', title)
-            title = re.sub(r'\bIn\b', 'in', title)
-            title = re.sub(r'\bOn\b', 'on', title)
-            title = re.sub(r'\bTo\b', 'to', title)
-            title = re.sub(r'\bFor\b', 'for', title)
-            title = re.sub(r'\bAt\b', 'at', title)
+            # (title is whitespace-normalized above, so split/join is lossless)
+            first, *rest = title.split(' ')
+            title = ' '.join([first] + [_SMALL_WORDS.get(w, w) for w in rest])
             
             # Capitalize first letter
             if title:
@@ -832,18 +1107,10 @@ def clean_display_title(name: str) -> str:
             return f"{title} ({year})"
     
     # Fallback: If no year found, try to extract title before common tech markers
-    tech_markers = [
-        r'\b1080p\b', r'\b720p\b', r'\b2160p\b', r'\b480p\b', r'\b4K\b',
-        r'\bHDRip\b', r'\bWEBRip\b', r'\bWEB-DL\b', r'\bBluRay\b', r'\bBRRip\b',
-        r'\bHDTV\b', r'\bCAM\b', r'\bTS\b', r'\bTC\b',
-        r'\bx264\b', r'\bx265\b', r'\bHEVC\b', r'\bH\s*264\b', r'\bH\s*265\b',
-    ]
-    
-    for marker in tech_markers:
-        match = re.search(marker, name, re.IGNORECASE)
-        if match and match.start() > 5:  # Ensure we have some title
+    for match in _TECH_MARKER_RE.finditer(name):
+        if match.start() > 5:  # Ensure we have some title
             title = name[:match.start()].strip()
-            title = re.sub(r'[\s\-:]+$', '', title)
+            title = _TRAILING_PUNCT_RE.sub('', title)
             
             if title:
                 title = title.title()
@@ -852,7 +1119,7 @@ def clean_display_title(name: str) -> str:
                 return title
     
     # Last resort: just clean up and return
-    name = re.sub(r'\s+', ' ', name).strip()
+    name = _WS_RE.sub(' ', name).strip()
     name = name.title()
     if name:
         name = name[0].upper() + name[1:]
@@ -866,7 +1133,7 @@ def fetch_tpb_top100_movies() -> List[Dict]:
     Returns list of dicts with normalized fields.
     """
     TPB_TOP100_URL = 'https://apibay.org/precompiled/data_top100_207.json'
-    response = fetch_url(TPB_TOP100_URL, timeout=10)
+    response = fetch_url_revalidated(TPB_TOP100_URL, timeout=10)
     if not response:
         return []
     
@@ -874,9 +1141,6 @@ def fetch_tpb_top100_movies() -> List[Dict]:
         data = json.loads(response)
         movies = []
         
-        # Regex to detect TV Shows
-        tv_pattern = re.compile(r'(S\d{1,2}E\d{1,2}|Season\s*\d+|Complete\s*Series|\d+x\d+)', re.IGNORECASE)
-        
         for item in data[:100]:
             info_hash = item.get('info_hash', '')
             if not info_hash or info_hash == '0' * 40:
@@ -885,17 +1149,20 @@ def fetch_tpb_top100_movies() -> List[Dict]:
             name = item.get('name', 'Unknown')
             
             # Skip TV shows
-            if tv_pattern.search(name):
+            if _TV_RE.search(name):
                 continue
             
-            # Extract year from name
-            year_match = re.search(r'(19|20)\d{2}', name)
-            year = year_match.group(0) if year_match else ''
-            
             # Generate clean search title for YTS/API lookups
             cleaned = clean_display_title(name)
-            # Extract just the title part (without year) for searching
-            search_title = re.sub(r'\s*\(\d{4}\)\s*$', '', cleaned).strip()
+            # Split "Title (Year)" into the search title and the release year.
+            # Reusing clean_display_title's year (the one right after the
+            # title) avoids a rescan and the first-four-digits trap:
+            # "2001 A Space Odyssey 1968", "Blade Runner 2049 (2017)"
+            title_year = _DISPLAY_TITLE_YEAR_RE.fullmatch(cleaned)
+            if title_year:
+                search_title, year = title_year.group(1).strip(), title_year.group(2)
+            else:
+                search_title, year = cleaned.strip(), ''
             
             movies.append({
                 'name': name,
@@ -929,28 +1196,31 @@ def enrich_movie_with_sources(movie: Dict) -> Dict:
     
     # Add original TPB torrent if present
     if movie.get('info_hash'):
-        size_bytes = int(movie.get('size', 0))
-        size_mb = size_bytes // (1024 * 1024)
         torrents.append({
             'source': 'TPB',
             'hash': movie['info_hash'],
             'quality': extract_quality(movie.get('name', '')),
-            'size': f"{size_mb}MB" if size_mb < 1024 else f"{size_mb/1024:.1f}GB",
+            'size': format_size(int(movie.get('size', 0))),
             'seeds': movie.get('seeders', 0),
             'magnet': f"magnet:?xt=urn:btih:{movie['info_hash']}"
         })
     
+    # Deduplicate by hash
+    seen_hashes = {t['hash'] for t in torrents}
+    
     # Search TPB for more sources
     tpb_results = search_tpb(search_query, category=207)
     for t in tpb_results:
-        if t.get('hash') and t['hash'] not in [x['hash'] for x in torrents]:
+        if t.get('hash') and t['hash'] not in seen_hashes:
             torrents.append(t)
+            seen_hashes.add(t['hash'])
     
     # Search YTS for sources
     yts_results = search_yts(search_query)
     for t in yts_results:
-        if t.get('hash') and t['hash'] not in [x['hash'] for x in torrents]:
+        if t.get('hash') and t['hash'] not in seen_hashes:
             torrents.append(t)
+            seen_hashes.add(t['hash'])
     
     movie['torrents'] = torrents
     return movie
@@ -996,14 +1266,17 @@ def aggregate_movie(movie: Dict) -> Optional[str]:
         return None
     
     # Sort by seeds (descending)
-    all_torrents.sort(key=lambda x: x.get('seeds', 0), reverse=True)
+    all_torrents.sort(key=itemgetter('seeds'), reverse=True)
     
     # Format arrays for COMBINED output
-    per_torrent_sources = [t['source'] for t in all_torrents]
-    qualities = [t.get('quality', 'Unknown') for t in all_torrents]
-    seeds = [str(t.get('seeds', 0)) for t in all_torrents]
-    sizes = [t.get('size', 'N/A') for t in all_torrents]
-    magnets = [t.get('magnet', '') for t in all_torrents]
+    per_torrent_sources, qualities, seeds, sizes, magnets = [], [], [], [], []
+    for t in all_torrents:
+        get = t.get
+        per_torrent_sources.append(t['source'])
+        qualities.append(get('quality', 'Unknown'))
+        seeds.append(t['seeds'])
+        sizes.append(get('size', 'N/A'))
+        magnets.append(get('magnet', ''))
     
     rating_str = f"{rating}/10" if rating else 'N/A'
     genres = movie.get('genres', [])
@@ -1014,7 +1287,7 @@ def aggregate_movie(movie: Dict) -> Optional[str]:
         f"COMBINED|{display_title}|"
         f"{'^'.join(per_torrent_sources)}|"
         f"{'^'.join(qualities)}|"
-        f"{'^'.join(seeds)}|"
+        f"{'^'.join(map(str, seeds))}|"
         f"{'^'.join(sizes)}|"
         f"{'^'.join(magnets)}|"
         f"{poster}|"
@@ -1053,12 +1326,9 @@ def fetch_enriched_catalog(limit: int = 50, page: int = 1, sort_by: str = 'date_
                 items = search_tpb(query_term, category=207)
                 return group_movies_by_title([{'source': 'TPB', **i} for i in items], limit)
             
-            results = []
-            for movie in movies:
-                result = aggregate_movie(movie)
-                if result:
-                    results.append(result)
-            return results
+            # Each movie costs a TPB search: run them side by side (map keeps YTS order)
+            with ThreadPoolExecutor(max_workers=search_workers(len(movies))) as executor:
+                return [result for result in executor.map(aggregate_movie, movies) if result]
         else:
             # Shows search
             tpb_cat = 208
@@ -1083,90 +1353,115 @@ def fetch_enriched_catalog(limit: int = 50, page: int = 1, sort_by: str = 'date_
     # PHASE 1: Fetch TPB Top 100 Movies (skip if start_page > 1 for incremental fetch)
     # ═══════════════════════════════════════════════════════════════
     all_movies = {}  # Keyed by normalized title for deduplication
+    seen_hashes = {}  # Same keys: hashes already in all_movies[key]['torrents']
+    
+    def add_movie(key: str, movie: Dict) -> Optional[Dict]:
+        """Insert movie under key, or merge its new torrents into the existing entry (returned)."""
+        existing = all_movies.get(key)
+        if existing is None:
+            all_movies[key] = movie
+            seen_hashes[key] = {t['hash'] for t in movie.get('torrents', [])}
+            return None
+        hashes = seen_hashes[key]
+        for t in movie.get('torrents', []):
+            if t['hash'] not in hashes:
+                existing['torrents'].append(t)
+                hashes.add(t['hash'])
+        return existing
     
     # Only fetch TPB on initial load (start_page == 1), not on incremental prefetch
     tpb_top100 = [] if skip_tpb or start_page > 1 else fetch_tpb_top100_movies()
     
     # Enrich TPB movies with additional sources (parallel)
-    with ThreadPoolExecutor(max_workers=15) as executor:
-        futures = {executor.submit(enrich_movie_with_sources, m): m for m in tpb_top100}
-        for future in as_completed(futures, timeout=30):
+    executor = ThreadPoolExecutor(max_workers=search_workers(len(tpb_top100)))
+    try:
+        futures = [executor.submit(enrich_movie_with_sources, m) for m in tpb_top100]
+        # Merge in top-100 order so the result doesn't depend on which search
+        # answered first; one 30s budget covers the whole phase
+        deadline = time.monotonic() + 30
+        for future in futures:
             try:
-                enriched = future.result(timeout=5)
+                enriched = future.result(timeout=max(0, deadline - time.monotonic()))
                 if enriched and enriched.get('torrents'):
-                    key = normalize_movie_title(enriched.get('name', ''))
-                    if key not in all_movies:
-                        all_movies[key] = enriched
-                    else:
-                        # Merge torrents
-                        existing_hashes = {t['hash'] for t in all_movies[key].get('torrents', [])}
-                        for t in enriched.get('torrents', []):
-                            if t['hash'] not in existing_hashes:
-                                all_movies[key]['torrents'].append(t)
+                    add_movie(normalize_movie_title(enriched.get('name', '')), enriched)
             except Exception:
-                pass
+                _degraded.set()
+    finally:
+        # Not a `with` block: its exit would wait out the searches the deadline
+        # gave up on. Queued ones are dropped; in-flight ones end on their own timeouts
+        executor.shutdown(wait=False, cancel_futures=True)
     
     # ═══════════════════════════════════════════════════════════════
     # PHASE 2: Fetch YTS Latest Pages 1-N
     # ═══════════════════════════════════════════════════════════════
-    def fetch_and_enrich_yts_page(p: int) -> List[Dict]:
-        """Fetch a YTS page and enrich each movie."""
-        movies = fetch_yts_movies(limit=50, page=p, sort_by=sort_by, 
-                                  genre=genre, min_rating=min_rating, order_by=order_by)
-        enriched = []
-        for movie in movies:
-            title = movie.get('title', '')
-            year = movie.get('year', '')
-            
-            # Parse YTS torrents
-            torrents = parse_yts_torrents(movie)
-            
-            # Search TPB for additional sources
-            tpb_results = search_tpb(f"{title} {year}", category=207)
-            seen_hashes = {t['hash'] for t in torrents}
-            for t in tpb_results:
-                if t.get('hash') and t['hash'] not in seen_hashes:
-                    torrents.append(t)
-                    seen_hashes.add(t['hash'])
-            
-            enriched.append({
-                'name': f"{title} ({year})",
-                'clean_title': title.lower(),
-                'year': str(year),
-                'torrents': torrents,
-                'poster': movie.get('medium_cover_image', 'N/A'),
-                'rating': movie.get('rating', 0),
-                'genres': movie.get('genres', []),
-                'imdb': movie.get('imdb_code', '')
-            })
-        return enriched
-    
-    # Parallel fetch YTS pages (from start_page to yts_pages inclusive)
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        futures = {executor.submit(fetch_and_enrich_yts_page, p): p for p in range(start_page, yts_pages + 1)}
-        for future in as_completed(futures, timeout=60):
+    def enrich_yts_movie(movie: Dict) -> Dict:
+        """Add TPB sources to one YTS movie."""
+        title = movie.get('title', '')
+        year = movie.get('year', '')
+        
+        # Parse YTS torrents
+        torrents = parse_yts_torrents(movie)
+        
+        # Search TPB for additional sources
+        tpb_results = search_tpb(f"{title} {year}", category=207)
+        seen_hashes = {t['hash'] for t in torrents}
+        for t in tpb_results:
+            if t.get('hash') and t['hash'] not in seen_hashes:
+                torrents.append(t)
+                seen_hashes.add(t['hash'])
+        
+        name = f"{title} ({year})"
+        return {
+            'name': name,
+            'display_name': clean_display_title(name),
+            'clean_title': title.lower(),
+            'year': str(year),
+            'torrents': torrents,
+            'poster': movie.get('medium_cover_image', 'N/A'),
+            'rating': movie.get('rating', 0),
+            'genres': movie.get('genres', []),
+            'imdb': movie.get('imdb_code', '')
+        }
+    
+    # Parallel fetch YTS pages (from start_page to yts_pages inclusive). Each
+    # page's per-movie TPB searches go to one shared pool as soon as the page
+    # lands, instead of running one after another inside the page's worker.
+    page_searches = {}
+    with ThreadPoolExecutor(max_workers=search_workers(50 * (yts_pages - start_page + 1))) as search_pool:
+        with ThreadPoolExecutor(max_workers=10) as page_pool:
+            futures = {
+                page_pool.submit(fetch_yts_movies, limit=50, page=p, sort_by=sort_by,
+                                 genre=genre, min_rating=min_rating, order_by=order_by): p
+                for p in range(start_page, yts_pages + 1)
+            }
             try:
-                page_movies = future.result(timeout=15)
-                for movie in page_movies:
-                    key = normalize_movie_title(movie.get('name', ''))
-                    if key not in all_movies:
-                        all_movies[key] = movie
-                    else:
-                        # Merge torrents and prefer YTS metadata (has poster, rating, etc.)
-                        existing = all_movies[key]
-                        existing_hashes = {t['hash'] for t in existing.get('torrents', [])}
-                        for t in movie.get('torrents', []):
-                            if t['hash'] not in existing_hashes:
-                                existing['torrents'].append(t)
-                        # Update metadata if YTS has better info
-                        if movie.get('poster') and movie['poster'] != 'N/A':
-                            existing['poster'] = movie['poster']
-                        if movie.get('rating'):
-                            existing['rating'] = movie['rating']
-                        if movie.get('genres'):
-                            existing['genres'] = movie['genres']
-            except Exception:
-                pass
+                for future in as_completed(futures, timeout=60):
+                    try:
+                        movies = future.result(timeout=15)
+                    except Exception:
+                        _degraded.set()
+                        continue
+                    page_searches[futures[future]] = [search_pool.submit(enrich_yts_movie, m) for m in movies]
+            except FuturesTimeoutError:
+                _degraded.set()  # Pages still missing after 60s are left out
+        
+        # Merge in page order so the result doesn't depend on which page answered first
+        for p in sorted(page_searches):
+            for future in page_searches[p]:
+                try:
+                    movie = future.result()
+                except Exception:
+                    _degraded.set()
+                    continue
+                existing = add_movie(normalize_movie_title(movie.get('name', '')), movie)
+                if existing is not None:
+                    # Merged: prefer YTS metadata (has poster, rating, etc.)
+                    if movie.get('poster') and movie['poster'] != 'N/A':
+                        existing['poster'] = movie['poster']
+                    if movie.get('rating'):
+                        existing['rating'] = movie['rating']
+                    if movie.get('genres'):
+                        existing['genres'] = movie['genres']
     
     # ═══════════════════════════════════════════════════════════════
     # PHASE 3: Convert to COMBINED format
@@ -1179,14 +1474,17 @@ def fetch_enriched_catalog(limit: int = 50, page: int = 1, sort_by: str = 'date_
             continue
         
         # Sort torrents by seeds
-        torrents.sort(key=lambda x: int(x.get('seeds', 0)), reverse=True)
+        torrents.sort(key=itemgetter('seeds'), reverse=True)
         
-        # Build COMBINED arrays
-        sources = [t['source'] for t in torrents]
-        qualities = [t.get('quality', 'Unknown') for t in torrents]
-        seeds = [str(t.get('seeds', 0)) for t in torrents]
-        sizes = [t.get('size', 'N/A') for t in torrents]
-        magnets = [t.get('magnet', '') for t in torrents]
+        # Build COMBINED arrays in one pass over the torrents
+        sources, qualities, seeds, sizes, magnets = [], [], [], [], []
+        for t in torrents:
+            get = t.get
+            sources.append(t['source'])
+            qualities.append(get('quality', 'Unknown'))
+            seeds.append(t['seeds'])
+            sizes.append(get('size', 'N/A'))
+            magnets.append(get('magnet', ''))
         
         # Get metadata
         poster = movie.get('poster', 'N/A')
@@ -1195,15 +1493,15 @@ def fetch_enriched_catalog(limit: int = 50, page: int = 1, sort_by: str = 'date_
         genres = movie.get('genres', [])
         genre_str = ', '.join(genres) if genres else 'Unknown'
         
-        # Clean the display title (removes [1080p] [WEBRip] etc.)
-        raw_title = movie.get('name', key)
-        display_title = clean_display_title(raw_title)
+        # Display titles (without [1080p] [WEBRip] etc.) are cleaned in the
+        # phase 1/2 workers, off this serial loop
+        display_title = movie.get('display_name') or clean_display_title(movie.get('name', key))
         
         combined = (
             f"COMBINED|{display_title}|"
             f"{'^'.join(sources)}|"
             f"{'^'.join(qualities)}|"
-            f"{'^'.join(seeds)}|"
+            f"{'^'.join(map(str, seeds))}|"
             f"{'^'.join(sizes)}|"
             f"{'^'.join(magnets)}|"
             f"{poster}|"
@@ -1211,36 +1509,19 @@ def fetch_enriched_catalog(limit: int = 50, page: int = 1, sort_by: str = 'date_
             f"{genre_str}|"
             f"{len(torrents)}"
         )
-        results.append(combined)
+        # Sort keys come from the values at hand, not by re-parsing the line
+        year_match = _COMBINED_YEAR_RE.search(display_title)
+        year = int(year_match.group(1)) if year_match else 0
+        max_seeds = torrents[0]['seeds']  # torrents are sorted by seeds
+        results.append((year, max_seeds, combined))
     
     # ═══════════════════════════════════════════════════════════════
     # PHASE 4: Sort by year (newest first), then by max seeds
     # ═══════════════════════════════════════════════════════════════
-    def extract_year_from_combined(entry):
-        try:
-            parts = entry.split('|')
-            if len(parts) > 1:
-                match = re.search(r'\((\d{4})\)', parts[1])
-                if match:
-                    return int(match.group(1))
-        except:
-            pass
-        return 0
-    
-    def extract_max_seeds(entry):
-        try:
-            parts = entry.split('|')
-            if len(parts) > 4:
-                seeds = parts[4].split('^')
-                return max(int(s) for s in seeds if s.isdigit())
-        except:
-            pass
-        return 0
+    # Keys were computed once in phase 3; the sort is stable, so ties keep merge order
+    results.sort(key=lambda r: (r[0], r[1]), reverse=True)
     
-    # Sort by year desc, then by seeds desc
-    results.sort(key=lambda x: (extract_year_from_combined(x), extract_max_seeds(x)), reverse=True)
-    
-    return results
+    return [combined for _, _, combined in results]
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -1250,7 +1531,10 @@ def fetch_enriched_catalog(limit: int = 50, page: int = 1, sort_by: str = 'date_
 def main():
     import argparse
     
-    parser = argparse.ArgumentParser(description='Multi-source catalog fetcher (New Algorithm)')
+    parser = argparse.ArgumentParser(
+        description='Multi-source catalog fetcher (New Algorithm)',
+        epilog='Environment: TERMFLIX_FETCH_WORKERS sets the number of concurrent '
+               f'TPB/YTS searches (default {SEARCH_WORKERS}).')
     parser.add_argument('--limit', type=int, default=50, help='Movies per display page')
     parser.add_argument('--page', type=int, default=1, help='Display page number')
     parser.add_argument('--sort', type=str, default='date_added', 
@@ -1273,8 +1557,7 @@ def main():
     global REFRESH_CACHE
     REFRESH_CACHE = args.refresh
     
-    # Fetch Catalog using NEW enriched algorithm
-    catalog = fetch_enriched_catalog(
+    catalog_args = dict(
         limit=args.limit,
         page=args.page,
         sort_by=args.sort,
@@ -1288,9 +1571,27 @@ def main():
         skip_tpb=args.skip_tpb
     )
     
+    # The UI re-runs this for every page flip and filter toggle: reuse a
+    # recent identical run's output instead of redoing every fetch
+    cache_key = get_cache_key('catalog', repr(sorted(catalog_args.items())))
+    cached = get_cached(cache_key, CACHE_TTLS['catalog'])
+    if cached:
+        catalog = cached.split('\n')
+    else:
+        # Resolve this run's hosts while the first requests are being set up
+        tpb_host = urllib.parse.urlsplit(TPB_SEARCH_URL).hostname
+        if args.category == 'shows':
+            prewarm_dns([tpb_host] + EZTV_DOMAINS)
+        else:
+            prewarm_dns(YTS_DOMAINS + [tpb_host])
+        
+        # Fetch Catalog using NEW enriched algorithm
+        catalog = fetch_enriched_catalog(**catalog_args)
+        if catalog and not _degraded.is_set():
+            set_cache(cache_key, '\n'.join(catalog))
+    
     # Export to JSON if requested
     if args.json_export:
-        import json
         export_data = []
         for line in catalog:
             parts = line.split('|')
@@ -1310,8 +1611,10 @@ def main():
                     'raw_line': line
                 })
         
+        # json.dump streams thousands of tiny writes when indenting; encode
+        # once and write the document in a single call instead
         with open(args.json_export, 'w') as f:
-            json.dump({
+            f.write(json.dumps({
                 'total_movies': len(export_data),
                 'export_time': str(datetime.now()),
                 'args': {
@@ -1320,12 +1623,13 @@ def main():
                     'sort': args.sort
                 },
                 'movies': export_data
-            }, f, indent=2)
+            }, indent=2))
         
         print(f"Exported {len(export_data)} movies to {args.json_export}", file=sys.stderr)
-    else:
-        for line in catalog:
-            print(line, flush=True)
+    elif catalog:
+        # The catalog is complete before anything is printed: one write, not a flush per line
+        sys.stdout.write('\n'.join(catalog) + '\n')
+        sys.stdout.flush()
 
 if __name__ == '__main__':
     main()
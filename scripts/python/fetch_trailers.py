@@ -9,42 +9,146 @@ Usage:
 """
 
 import sys
+import os
 import re
+import gzip
+import json
+import time
+import hashlib
 import urllib.request
 import urllib.parse
+from pathlib import Path
+from typing import Optional
 
 USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15'
 
+# Search results cache: the same title is looked up again on every preview
+CACHE_DIR = Path.home() / '.cache' / 'termflix' / 'trailers'
+CACHE_TTL = 86400        # 24 hours
+CACHE_TTL_EMPTY = 3600   # "No trailers found" is retried sooner
+
+# YouTube embeds the search results as JSON in a ytInitialData script
+_INITIAL_DATA_MARKERS = ('var ytInitialData = ', 'window["ytInitialData"] = ')
+_JSON_DECODER = json.JSONDecoder()
+# Pattern fallback: videoId, then the title runs a few hundred characters
+# later (after the thumbnails)
+_VIDEO_ID_RE = re.compile(r'"videoId":"([a-zA-Z0-9_-]{11})"')
+_VIDEO_TITLE_RE = re.compile(r'"title":\{"runs":\[\{"text":"([^"]+)"\}')
+_VIDEO_TITLE_WINDOW = 4096
+_WATCH_ID_RE = re.compile(r'/watch\?v=([a-zA-Z0-9_-]{11})')
+_TITLE_YEAR_RE = re.compile(r'\s*\(([12][0-9]{3})\)\s*')
+
+
+def _cache_file(query: str, limit: int) -> str:
+    """Cache file for a query, normalized so case/spacing variants share it."""
+    normalized = ' '.join(query.lower().split())
+    key = hashlib.blake2b(f"{normalized}|{limit}".encode(), digest_size=16).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+
+def get_cached(query: str, limit: int) -> Optional[list[dict]]:
+    """Cached results for query if still fresh, else None."""
+    path = _cache_file(query, limit)
+    try:
+        age = time.time() - os.stat(path).st_mtime
+        if age >= CACHE_TTL:
+            return None
+        with open(path, encoding='utf-8') as f:
+            results = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not results and age >= CACHE_TTL_EMPTY:
+        return None
+    return results
+
+
+def set_cache(query: str, limit: int, results: list[dict]):
+    """Store results for query (write to a temp file, then rename into place)."""
+    path = _cache_file(query, limit)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(results, f)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+def _initial_data_videos(html: str) -> list[tuple[str, str]]:
+    """(video_id, title) pairs from the ytInitialData search results, in page order."""
+    for marker in _INITIAL_DATA_MARKERS:
+        start = html.find(marker)
+        if start != -1:
+            break
+    else:
+        return []
+    
+    videos = []
+    try:
+        # raw_decode stops at the end of the object, whatever script follows
+        data, _ = _JSON_DECODER.raw_decode(html, start + len(marker))
+        sections = data['contents']['twoColumnSearchResultsRenderer']['primaryContents']['sectionListRenderer']['contents']
+        for section in sections:
+            for item in section.get('itemSectionRenderer', {}).get('contents', ()):
+                renderer = item.get('videoRenderer')
+                if not renderer:
+                    continue
+                title = ''.join(run.get('text', '') for run in renderer.get('title', {}).get('runs', ()))
+                if renderer.get('videoId') and title:
+                    videos.append((renderer['videoId'], title))
+    except (ValueError, KeyError, TypeError, AttributeError):
+        pass
+    return videos
+
+
+def _regex_videos(html: str):
+    """(video_id, title) pairs found by pattern, for pages without usable ytInitialData."""
+    for match in _VIDEO_ID_RE.finditer(html):
+        # Title must follow within the same renderer, not some later video's
+        title_match = _VIDEO_TITLE_RE.search(html, match.end(), match.end() + _VIDEO_TITLE_WINDOW)
+        if title_match:
+            yield match.group(1), title_match.group(1)
+
 
 def search_youtube_trailers(query: str, limit: int = 3) -> list[dict]:
     """
     Search YouTube for trailers and return video links.
     Returns list of {title, url, duration} dicts.
     """
+    cached = get_cached(query, limit)
+    if cached is not None:
+        return cached
+    
     search_url = f"https://www.youtube.com/results?search_query={urllib.parse.quote(query)}"
     
     headers = {
         'User-Agent': USER_AGENT,
         'Accept-Language': 'en-US,en;q=0.9',
+        # The results page is 1MB+ of HTML; compressed it is a fraction of that
+        'Accept-Encoding': 'gzip',
     }
     
     try:
         request = urllib.request.Request(search_url, headers=headers)
         with urllib.request.urlopen(request, timeout=10) as response:
-            html = response.read().decode('utf-8', errors='ignore')
+            data = response.read()
+            if 'gzip' in response.headers.get('Content-Encoding', ''):
+                data = gzip.decompress(data)
+            html = data.decode('utf-8', errors='ignore')
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         return []
     
     results = []
     
-    # Pattern to find video IDs and titles in YouTube's initial data
-    # YouTube embeds video data in JSON format
-    video_pattern = r'"videoId":"([a-zA-Z0-9_-]{11})".*?"title":\{"runs":\[\{"text":"([^"]+)"\}'
-    matches = re.findall(video_pattern, html)
-    
+    # Find video IDs and titles in YouTube's initial data. The pattern scan
+    # is lazy: it stops once `limit` videos are kept
     seen_ids = set()
-    for video_id, title in matches:
+    for video_id, title in _initial_data_videos(html) or _regex_videos(html):
         if video_id in seen_ids:
             continue
         seen_ids.add(video_id)
@@ -64,8 +168,7 @@ def search_youtube_trailers(query: str, limit: int = 3) -> list[dict]:
     
     # Fallback: simpler pattern
     if not results:
-        simple_pattern = r'/watch\?v=([a-zA-Z0-9_-]{11})'
-        video_ids = re.findall(simple_pattern, html)
+        video_ids = _WATCH_ID_RE.findall(html)
         for vid in video_ids[:limit]:
             if vid not in seen_ids:
                 results.append({
@@ -75,30 +178,25 @@ def search_youtube_trailers(query: str, limit: int = 3) -> list[dict]:
                 })
                 seen_ids.add(vid)
     
+    # Only answers from YouTube are cached; fetch errors above return early
+    set_cache(query, limit, results)
     return results
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: fetch_trailers.py 'Movie Name (Year)' [--limit N]", file=sys.stderr)
-        sys.exit(1)
+    import argparse
     
-    title = sys.argv[1]
-    limit = 3
+    parser = argparse.ArgumentParser(description='YouTube Trailer Link Fetcher')
+    parser.add_argument('title', help="Movie or show title, e.g. 'Movie Name (2024)'")
+    parser.add_argument('--limit', type=int, default=3, help='Max trailers')
     
-    if '--limit' in sys.argv:
-        idx = sys.argv.index('--limit')
-        if idx + 1 < len(sys.argv):
-            try:
-                limit = int(sys.argv[idx + 1])
-            except ValueError:
-                pass
+    args = parser.parse_args()
     
     # Clean title for search
-    clean_title = re.sub(r'\s*\(([12][0-9]{3})\)\s*', r' \1 ', title).strip()
+    clean_title = _TITLE_YEAR_RE.sub(r' \1 ', args.title).strip()
     query = f"{clean_title} official trailer"
     
-    results = search_youtube_trailers(query, limit)
+    results = search_youtube_trailers(query, args.limit)
     
     if not results:
         print("No trailers found", file=sys.stderr)